@@ -135,6 +135,10 @@ class ConfigManager:
         self.config_file = self.config_dir / self.DEFAULT_CONFIG_FILE
         self._ensure_config_dir()
 
+        # Last parsed config, keyed by the file's (mtime_ns, size)
+        self._cached_config: Config | None = None
+        self._cached_key: tuple[int, int] | None = None
+
     def _ensure_config_dir(self) -> None:
         """Ensure the configuration directory exists."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -142,13 +146,34 @@ class ConfigManager:
     def load_config(self) -> Config:
         """Load configuration from disk.
 
+        The parsed file is cached and only re-read when its modification
+        time or size changes.
+
         Returns:
             Config object with loaded or default settings
         """
-        # If config file doesn't exist, return defaults
-        if not self.config_file.exists():
+        try:
+            st = self.config_file.stat()
+        except OSError:
+            # If config file doesn't exist, return defaults
+            self._cached_config = None
+            self._cached_key = None
             return Config()
 
+        key = (st.st_mtime_ns, st.st_size)
+        if self._cached_config is None or self._cached_key != key:
+            self._cached_config = self._read_config()
+            self._cached_key = key
+
+        # Hand out a deep copy so callers can't modify the cached config
+        return self._cached_config.model_copy(deep=True)
+
+    def _read_config(self) -> Config:
+        """Read and validate the config file.
+
+        Returns:
+            Config object with loaded or default settings
+        """
         try:
             with self.config_file.open("r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -167,12 +192,15 @@ class ConfigManager:
         Args:
             config: The Config object to save
         """
+        self._cached_config = None
+        self._cached_key = None
+
         # Convert to JSON-serializable dict
         config_dict = config.model_dump(mode="json")
 
         # Write to file with nice formatting
         with self.config_file.open("w", encoding="utf-8") as f:
-            json.dump(config_dict, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(config_dict, indent=2, ensure_ascii=False))
 
     def reset_config(self) -> Config:
         """Reset configuration to defaults.
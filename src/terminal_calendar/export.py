@@ -2,12 +2,57 @@
 
 import csv
 import datetime as dt
-import json
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TextIO
 
+from . import jsonio
 from .models import Schedule, AppState
 
+# Write buffer for streamed exports, so large schedules need few syscalls
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+_ICAL_HEADER = (
+    "BEGIN:VCALENDAR\n",
+    "VERSION:2.0\n",
+    "PRODID:-//Terminal Calendar//EN\n",
+    "CALSCALE:GREGORIAN\n",
+    "METHOD:PUBLISH\n",
+)
+
+_ICAL_EVENT_TEMPLATE = (
+    "BEGIN:VEVENT\n"
+    "UID:{uid}@terminal-calendar\n"
+    "DTSTAMP:{dtstamp}\n"
+    "DTSTART:{start}\n"
+    "DTEND:{end}\n"
+    "SUMMARY:{summary}\n"
+    "DESCRIPTION:{description}\n"
+    "PRIORITY:{priority}\n"
+    "END:VEVENT\n"
+)
+
+_ICAL_DATETIME_FORMAT = "%Y%m%dT%H%M%S"
+
+# Map priority to iCal priority (1=high, 5=medium, 9=low)
+_ICAL_PRIORITIES = {
+    "high": "1",
+    "medium": "5",
+    "low": "9",
+}
+
+_CSV_FIELDNAMES = (
+    "task_id",
+    "title",
+    "start_time",
+    "end_time",
+    "duration_minutes",
+    "description",
+    "priority",
+    "completed",
+    "notes_count",
+)
+
 
 def export_to_ical(schedule: Schedule, output_path: Path) -> None:
     """Export schedule to iCalendar format.
@@ -16,50 +61,45 @@ def export_to_ical(schedule: Schedule, output_path: Path) -> None:
         schedule: The schedule to export
         output_path: Path to write the .ics file
     """
-    lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "PRODID:-//Terminal Calendar//EN",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
-    ]
+    with output_path.open("w", encoding="utf-8", buffering=_EXPORT_BUFFER_SIZE) as f:
+        f.writelines(_ical_lines(schedule))
+
+
+def _ical_lines(schedule: Schedule) -> Iterator[str]:
+    """Yield the newline-terminated lines of an iCalendar document.
+
+    Args:
+        schedule: The schedule to export
+
+    Yields:
+        Chunks of the calendar: header lines, one VEVENT block per task,
+        then the closing line
+    """
+    yield from _ICAL_HEADER
+
+    # One timestamp for the whole export
+    created_str = dt.datetime.now().strftime(_ICAL_DATETIME_FORMAT)
 
     for task in schedule.tasks:
-        # Convert to datetime
+        # Format for iCal (YYYYMMDDTHHMMSS)
         start_dt = dt.datetime.combine(schedule.date, task.get_start_time())
         end_dt = dt.datetime.combine(schedule.date, task.get_end_time())
+        start_str = start_dt.strftime(_ICAL_DATETIME_FORMAT)
+        end_str = end_dt.strftime(_ICAL_DATETIME_FORMAT)
 
-        # Format for iCal (YYYYMMDDTHHMMSS)
-        start_str = start_dt.strftime("%Y%m%dT%H%M%S")
-        end_str = end_dt.strftime("%Y%m%dT%H%M%S")
-        created_str = dt.datetime.now().strftime("%Y%m%dT%H%M%S")
-
-        # Map priority to iCal priority (1=high, 5=medium, 9=low)
-        priority_map = {
-            "high": "1",
-            "medium": "5",
-            "low": "9",
-        }
-        ical_priority = priority_map.get(task.priority, "5")
-
-        lines.extend([
-            "BEGIN:VEVENT",
-            f"UID:{task.id}@terminal-calendar",
-            f"DTSTAMP:{created_str}",
-            f"DTSTART:{start_str}",
-            f"DTEND:{end_str}",
-            f"SUMMARY:{task.title}",
-            f"DESCRIPTION:{task.description}",
-            f"PRIORITY:{ical_priority}",
-            "END:VEVENT",
-        ])
-
-    lines.extend([
-        "END:VCALENDAR",
-        "",  # Trailing newline
-    ])
+        yield _ICAL_EVENT_TEMPLATE.format_map(
+            {
+                "uid": task.id,
+                "dtstamp": created_str,
+                "start": start_str,
+                "end": end_str,
+                "summary": task.title,
+                "description": task.description,
+                "priority": _ICAL_PRIORITIES.get(task.priority, "5"),
+            }
+        )
 
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    yield "END:VCALENDAR\n"
 
 
 def export_to_csv(
@@ -74,36 +114,32 @@ def export_to_csv(
         output_path: Path to write the .csv file
         state: Optional state for completion status
     """
-    with output_path.open("w", newline="", encoding="utf-8") as csvfile:
-        fieldnames = [
-            "task_id",
-            "title",
-            "start_time",
-            "end_time",
-            "duration_minutes",
-            "description",
-            "priority",
-            "completed",
-            "notes_count",
-        ]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for task in schedule.tasks:
-            completed = state.is_complete(task.id) if state else False
-            notes_count = len(state.get_notes(task.id)) if state else 0
+    if state is not None:
+        completed_ids = frozenset(state.completed_tasks)
+        task_notes = state.task_notes
+    else:
+        completed_ids = frozenset()
+        task_notes = {}
+
+    rows = (
+        (
+            task.id,
+            task.title,
+            task.start_time,
+            task.end_time,
+            task.duration_minutes(),
+            task.description,
+            task.priority,
+            "Yes" if task.id in completed_ids else "No",
+            len(task_notes.get(task.id, ())),
+        )
+        for task in schedule.tasks
+    )
 
-            writer.writerow({
-                "task_id": task.id,
-                "title": task.title,
-                "start_time": task.start_time,
-                "end_time": task.end_time,
-                "duration_minutes": task.duration_minutes(),
-                "description": task.description,
-                "priority": task.priority,
-                "completed": "Yes" if completed else "No",
-                "notes_count": notes_count,
-            })
+    with output_path.open("w", newline="", encoding="utf-8", buffering=_EXPORT_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(_CSV_FIELDNAMES)
+        writer.writerows(rows)
 
 
 def export_to_json(
@@ -125,10 +161,12 @@ def export_to_json(
 
     # Add state information if provided
     if state:
+        completed_ids = frozenset(state.completed_tasks)
+
         # Add completion status to each task
         for task_data in data["tasks"]:
             task_id = task_data["id"]
-            task_data["completed"] = state.is_complete(task_id)
+            task_data["completed"] = task_id in completed_ids
 
             # Add notes if requested
             if include_notes:
@@ -142,8 +180,42 @@ def export_to_json(
                 ]
 
     # Write to file
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    output_path.write_bytes(jsonio.dumps(data))
+
+
+def export_all(
+    schedule: Schedule,
+    output_dir: Path,
+    state: AppState | None = None,
+) -> dict[str, Path]:
+    """Export a schedule to iCal, CSV and JSON at once.
+
+    Files are named ``schedule-YYYY-MM-DD.<ext>`` inside ``output_dir``.
+
+    Args:
+        schedule: The schedule to export
+        output_dir: Directory to write the files to
+        state: Optional state for completion status and notes
+
+    Returns:
+        Map of format name ("ical", "csv", "json") to the written path
+
+    Raises:
+        OSError: If any of the files cannot be written
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"schedule-{schedule.date.isoformat()}"
+    paths = {
+        "ical": output_dir / f"{stem}.ics",
+        "csv": output_dir / f"{stem}.csv",
+        "json": output_dir / f"{stem}.json",
+    }
+
+    export_to_ical(schedule, paths["ical"])
+    export_to_csv(schedule, paths["csv"], state)
+    export_to_json(schedule, paths["json"], state)
+
+    return paths
 
 
 def export_report_to_csv(
@@ -167,8 +239,9 @@ def export_report_to_csv(
         writer.writerow([])
 
         # Statistics
+        completed_ids = frozenset(state.completed_tasks)
         total = len(schedule.tasks)
-        completed = len(state.completed_tasks)
+        completed = len(completed_ids)
         completion_pct = state.get_completion_percentage(total)
 
         writer.writerow(["Total Tasks", total])
@@ -181,7 +254,7 @@ def export_report_to_csv(
         completed_minutes = sum(
             task.duration_minutes()
             for task in schedule.tasks
-            if state.is_complete(task.id)
+            if task.id in completed_ids
         )
 
         writer.writerow(["Total Time (hours)", f"{total_minutes / 60:.1f}"])
@@ -196,7 +269,7 @@ def export_report_to_csv(
             priority_tasks = [t for t in schedule.tasks if t.priority == priority]
             priority_completed = len([
                 t for t in priority_tasks
-                if state.is_complete(t.id)
+                if t.id in completed_ids
             ])
             priority_total = len(priority_tasks)
             priority_pct = (priority_completed / priority_total * 100) if priority_total > 0 else 0
@@ -224,7 +297,7 @@ def export_report_to_csv(
         ])
 
         for task in schedule.tasks:
-            completed_str = "Yes" if state.is_complete(task.id) else "No"
+            completed_str = "Yes" if task.id in completed_ids else "No"
             notes = state.get_notes(task.id)
             notes_str = f"{len(notes)} note(s)" if notes else "No notes"
 
@@ -252,15 +325,16 @@ def export_report_to_json(
         state: The application state
         output_path: Path to write the .json file
     """
+    completed_ids = frozenset(state.completed_tasks)
     total = len(schedule.tasks)
-    completed = len(state.completed_tasks)
+    completed = len(completed_ids)
 
     # Calculate statistics
     total_minutes = sum(task.duration_minutes() for task in schedule.tasks)
     completed_minutes = sum(
         task.duration_minutes()
         for task in schedule.tasks
-        if state.is_complete(task.id)
+        if task.id in completed_ids
     )
 
     # Priority breakdown
@@ -269,7 +343,7 @@ def export_report_to_json(
         priority_tasks = [t for t in schedule.tasks if t.priority == priority]
         priority_completed = len([
             t for t in priority_tasks
-            if state.is_complete(t.id)
+            if t.id in completed_ids
         ])
         priority_total = len(priority_tasks)
 
@@ -301,7 +375,7 @@ def export_report_to_json(
                 "end_time": task.end_time,
                 "duration_minutes": task.duration_minutes(),
                 "priority": task.priority,
-                "completed": state.is_complete(task.id),
+                "completed": task.id in completed_ids,
                 "notes": [
                     {
                         "timestamp": note.timestamp.isoformat(),
@@ -314,5 +388,4 @@ def export_report_to_json(
         ],
     }
 
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    output_path.write_bytes(jsonio.dumps(report))
@@ -0,0 +1,56 @@
+"""JSON encoding and file-writing helpers for terminal calendar persistence and exports.
+
+Uses orjson when it is installed and falls back to the standard library
+``json`` module otherwise. Both backends produce the same 2-space indented,
+non-ASCII-preserving output.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to pretty-printed UTF-8 JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace a file's contents so readers never see a partial write.
+
+    The data is written in one call to a sibling ``.tmp`` file, which is
+    then renamed over ``path``. The temp file is removed if anything fails.
+
+    Args:
+        path: File to write
+        data: Complete new file contents
+
+    Raises:
+        OSError: If the file cannot be written or replaced
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        raise
@@ -1,10 +1,21 @@
 """Data models for terminal calendar application."""
 
+import bisect
 import datetime as dt
-from typing import Literal
+import itertools
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any, Literal, NamedTuple, Self
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+# Per-instance caches derived from a task's start_time/end_time
+_TASK_TIME_CACHES = ("start_minutes", "end_minutes", "_start_time_obj", "_end_time_obj")
+
+# Bumped whenever a task's times change after validation, so schedules can
+# tell that their cached minute tables are stale
+_task_time_edits = 0
+
 
 class Task(BaseModel):
     """A single task/event in the schedule.
@@ -28,36 +39,90 @@ class Task(BaseModel):
     @model_validator(mode="after")
     def validate_end_after_start(self) -> "Task":
         """Validate that end_time is after start_time."""
-        start_hour, start_min = map(int, self.start_time.split(":"))
-        end_hour, end_min = map(int, self.end_time.split(":"))
-
-        start_minutes = start_hour * 60 + start_min
-        end_minutes = end_hour * 60 + end_min
-
-        if end_minutes <= start_minutes:
+        # Also primes the cached minute values used by validator/report code
+        if self.end_minutes <= self.start_minutes:
             raise ValueError(
                 f"end_time ({self.end_time}) must be after start_time ({self.start_time})"
             )
 
         return self
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping cached time values when a time changes."""
+        super().__setattr__(name, value)
+        if name in ("start_time", "end_time"):
+            self._clear_time_caches()
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the task, dropping cached time values if the update changes a time.
+
+        Args:
+            update: Field values to change in the copy
+            deep: Whether to deep-copy the task
+
+        Returns:
+            The copied Task
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update and ("start_time" in update or "end_time" in update):
+            copied._clear_time_caches()
+        return copied
+
+    def _clear_time_caches(self) -> None:
+        """Forget values derived from start_time/end_time."""
+        global _task_time_edits
+        for name in _TASK_TIME_CACHES:
+            self.__dict__.pop(name, None)
+        _task_time_edits += 1
+
     def get_start_time(self) -> dt.time:
         """Convert start_time string to time object."""
-        hour, minute = map(int, self.start_time.split(":"))
-        return dt.time(hour=hour, minute=minute)
+        return self._start_time_obj
 
     def get_end_time(self) -> dt.time:
         """Convert end_time string to time object."""
-        hour, minute = map(int, self.end_time.split(":"))
-        return dt.time(hour=hour, minute=minute)
+        return self._end_time_obj
+
+    @cached_property
+    def _start_time_obj(self) -> dt.time:
+        """Start time as a time object (cached until the time changes)."""
+        return dt.time(*divmod(self.start_minutes, 60))
+
+    @cached_property
+    def _end_time_obj(self) -> dt.time:
+        """End time as a time object (cached until the time changes)."""
+        return dt.time(*divmod(self.end_minutes, 60))
+
+    @cached_property
+    def start_minutes(self) -> int:
+        """Start time as minutes since midnight (cached until the time changes)."""
+        hour, minute = self.start_time.split(":")
+        return int(hour) * 60 + int(minute)
+
+    @cached_property
+    def end_minutes(self) -> int:
+        """End time as minutes since midnight (cached until the time changes)."""
+        hour, minute = self.end_time.split(":")
+        return int(hour) * 60 + int(minute)
 
     def duration_minutes(self) -> int:
         """Calculate task duration in minutes."""
-        start = self.get_start_time()
-        end = self.get_end_time()
-        start_minutes = start.hour * 60 + start.minute
-        end_minutes = end.hour * 60 + end.minute
-        return end_minutes - start_minutes
+        return self.end_minutes - self.start_minutes
+
+
+class _MinuteTable(NamedTuple):
+    """Snapshot of a schedule's task list with its start/end minutes.
+
+    running_max_end is the running maximum of the end minutes, or None if the
+    list is no longer in start order (it was reordered after validation).
+    time_edits is the value of _task_time_edits when the snapshot was taken.
+    """
+
+    tasks: list[Task]
+    starts: tuple[int, ...]
+    ends: tuple[int, ...]
+    running_max_end: tuple[int, ...] | None
+    time_edits: int
 
 
 class Schedule(BaseModel):
@@ -85,7 +150,38 @@ class Schedule(BaseModel):
     @classmethod
     def sort_tasks_by_time(cls, v: list[Task]) -> list[Task]:
         """Sort tasks by start time."""
-        return sorted(v, key=lambda t: t.get_start_time())
+        return sorted(v, key=lambda t: t.start_minutes)
+
+    @cached_property
+    def _minute_table(self) -> _MinuteTable:
+        """Snapshot of the task list with its start/end minutes."""
+        time_edits = _task_time_edits
+        tasks = list(self.tasks)
+        starts = tuple(task.start_minutes for task in tasks)
+        ends = tuple(task.end_minutes for task in tasks)
+        in_order = all(a <= b for a, b in itertools.pairwise(starts))
+        running_max_end = tuple(itertools.accumulate(ends, max)) if in_order else None
+        return _MinuteTable(tasks, starts, ends, running_max_end, time_edits)
+
+    def _current_minute_table(self) -> _MinuteTable:
+        """Return the minute table, rebuilding it if any task or its times changed."""
+        table = self._minute_table
+        if table.time_edits != _task_time_edits or table.tasks != self.tasks:
+            del self._minute_table
+            table = self._minute_table
+        return table
+
+    def minute_bounds(self) -> tuple[tuple[int, ...], tuple[int, ...]]:
+        """Get task start and end times as minutes since midnight.
+
+        The values are cached and rebuilt only when the task list or a task's
+        times change.
+
+        Returns:
+            Tuple of (start minutes, end minutes), in task list order
+        """
+        table = self._current_minute_table()
+        return table.starts, table.ends
 
     def get_task_by_id(self, task_id: str) -> Task | None:
         """Get a task by its ID.
@@ -113,10 +209,24 @@ class Schedule(BaseModel):
         if current_time is None:
             current_time = dt.datetime.now().time()
 
-        for task in self.tasks:
-            if task.get_start_time() <= current_time < task.get_end_time():
-                return task
-        return None
+        # Task bounds are whole minutes, so comparing against the truncated
+        # minute gives the same answer as comparing time objects
+        minute = current_time.hour * 60 + current_time.minute
+        # Index the live list: the snapshot may hold equal but distinct tasks
+        _, starts, ends, running_max_end, _ = self._current_minute_table()
+        tasks = self.tasks
+
+        if running_max_end is None:
+            for task, start, end in zip(tasks, starts, ends, strict=True):
+                if start <= minute < end:
+                    return task
+            return None
+
+        # Tasks before `started` have begun; the first of them still running
+        # is the first whose running maximum end lies past `minute`
+        started = bisect.bisect_right(starts, minute)
+        index = bisect.bisect_right(running_max_end, minute, 0, started)
+        return tasks[index] if index < started else None
 
     def get_upcoming_tasks(self, current_time: dt.time | None = None, limit: int = 3) -> list[Task]:
         """Get upcoming tasks after the given time.
@@ -131,11 +241,16 @@ class Schedule(BaseModel):
         if current_time is None:
             current_time = dt.datetime.now().time()
 
-        upcoming = [
-            task for task in self.tasks
-            if task.get_start_time() > current_time
-        ]
-        return upcoming[:limit]
+        minute = current_time.hour * 60 + current_time.minute
+        _, starts, _, running_max_end, _ = self._current_minute_table()
+        tasks = self.tasks
+
+        if running_max_end is None:
+            upcoming = [task for task, start in zip(tasks, starts, strict=True) if start > minute]
+            return upcoming[:limit]
+
+        first = bisect.bisect_right(starts, minute)
+        return tasks[first : first + limit]
 
 
 class TaskNote(BaseModel):
@@ -1,14 +1,76 @@
 """Report generation for terminal calendar."""
 
-import datetime as dt
+import functools
+import heapq
+import io
+import json
+import os
+import time
+from collections import Counter
 from pathlib import Path
 
 from .models import Schedule, AppState
 
+# Append-only index of saved reports' completion percentages
+REPORT_INDEX_FILE = ".index.jsonl"
+
+_SEP_EQ = "=" * 70
+_SEP_DASH = "-" * 70
+
+_PRIORITY_MARKERS = {
+    "high": "!!!",
+    "medium": "!!",
+    "low": "!",
+}
+
+# English day and month names for the report header, indexed by
+# date.weekday() and date.month - 1
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
+# Rendered report bodies, as text and UTF-8 bytes, keyed by
+# (date, task fields, completed IDs)
+_REPORT_CACHE_SIZE = 16
+_report_body_cache: dict[tuple, tuple[str, bytes]] = {}
+
+
+@functools.cache
+def _format_duration(minutes: int) -> str:
+    """Format a duration in minutes as "Xh Ym" (or "Ym" under an hour).
+
+    Task durations fall within a single day, so the cache holds at most
+    1440 short strings.
+    """
+    hours, mins = divmod(minutes, 60)
+    return f"{hours}h {mins}m" if hours > 0 else f"{mins}m"
+
+
+def _truncate(text: str, limit: int = 60) -> str:
+    """Shorten text to ``limit`` characters, marking cuts with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
 
 def generate_report(schedule: Schedule, state: AppState) -> str:
     """Generate an end-of-day report.
 
+    The report body is cached by a fingerprint of the schedule and the
+    completed task IDs; only the "Report generated" footer is rebuilt when
+    nothing else has changed.
+
     Args:
         schedule: The schedule to report on
         state: The application state with completion data
@@ -16,149 +78,157 @@ def generate_report(schedule: Schedule, state: AppState) -> str:
     Returns:
         Formatted report string
     """
+    body, _ = _cached_report_body(schedule, state)
+    return body + _report_footer()
+
+
+def _cached_report_body(schedule: Schedule, state: AppState) -> tuple[str, bytes]:
+    """Return the report body as text and UTF-8 bytes, rendering it on a cache miss.
+
+    Args:
+        schedule: The schedule to report on
+        state: The application state with completion data
+
+    Returns:
+        Tuple of (body text, body encoded as UTF-8)
+    """
+    completed_ids = frozenset(state.completed_tasks)
+    key = (
+        schedule.date,
+        tuple(
+            (task.id, task.title, task.start_time, task.end_time, task.description, task.priority)
+            for task in schedule.tasks
+        ),
+        completed_ids,
+    )
+    cached = _report_body_cache.get(key)
+    if cached is None:
+        body = _render_report_body(schedule, state, completed_ids)
+        cached = (body, body.encode("utf-8"))
+        if len(_report_body_cache) >= _REPORT_CACHE_SIZE:
+            # Evict the oldest entry
+            del _report_body_cache[next(iter(_report_body_cache))]
+        _report_body_cache[key] = cached
+    return cached
+
+
+def _report_footer() -> str:
+    """Return the "Report generated" footer stamped with the current time."""
+    return f"Report generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n{_SEP_EQ}"
+
+
+def _render_report_body(
+    schedule: Schedule,
+    state: AppState,
+    completed_ids: frozenset[str],
+) -> str:
+    """Render everything in the report above the "Report generated" line.
+
+    Args:
+        schedule: The schedule to report on
+        state: The application state with completion data
+        completed_ids: Snapshot of the completed task IDs
+
+    Returns:
+        Report text, ending with the separator before the footer
+    """
+    buf = io.StringIO()
+    w = buf.write
+
     # Header
-    report_lines = [
-        "=" * 70,
-        f"DAILY PRODUCTIVITY REPORT",
-        f"Date: {schedule.date.strftime('%A, %B %d, %Y')}",
-        "=" * 70,
-        "",
-    ]
+    w(_SEP_EQ + "\n")
+    w("DAILY PRODUCTIVITY REPORT\n")
+    d = schedule.date
+    w(f"Date: {_WEEKDAYS[d.weekday()]}, {_MONTHS[d.month - 1]} {d.day:02d}, {d.year}\n")
+    w(_SEP_EQ + "\n")
+    w("\n")
 
     # Summary statistics
     total_tasks = len(schedule.tasks)
-    completed_tasks = len(state.completed_tasks)
+    completed_tasks = len(completed_ids)
     incomplete_tasks = total_tasks - completed_tasks
     completion_pct = state.get_completion_percentage(total_tasks)
 
-    report_lines.extend([
-        "SUMMARY",
-        "-" * 70,
-        f"Total Tasks:      {total_tasks}",
-        f"Completed:        {completed_tasks} ({completion_pct:.1f}%)",
-        f"Incomplete:       {incomplete_tasks}",
-        "",
-    ])
-
-    # Time statistics
-    total_time_minutes = sum(task.duration_minutes() for task in schedule.tasks)
-    completed_time_minutes = sum(
-        task.duration_minutes()
-        for task in schedule.tasks
-        if task.id in state.completed_tasks
+    w("SUMMARY\n")
+    w(_SEP_DASH + "\n")
+    w(f"Total Tasks:      {total_tasks}\n")
+    w(f"Completed:        {completed_tasks} ({completion_pct:.1f}%)\n")
+    w(f"Incomplete:       {incomplete_tasks}\n")
+    w("\n")
+
+    # Per-task minute columns; the scheduled total comes straight from them
+    starts, ends = schedule.minute_bounds()
+    total_time_minutes = sum(ends) - sum(starts)
+
+    # Per-priority task counts, overall and among completed tasks
+    priority_totals: Counter[str] = Counter(task.priority for task in schedule.tasks)
+    priority_completed: Counter[str] = Counter(
+        task.priority for task in schedule.tasks if task.id in completed_ids
     )
 
+    # Single pass over tasks: accumulate completed time and render each
+    # task block into its section buffer
+    completed_time_minutes = 0
+    completed_buf = io.StringIO()
+    incomplete_buf = io.StringIO()
+
+    for task, start, end in zip(schedule.tasks, starts, ends, strict=True):
+        duration = end - start
+
+        if task.id in completed_ids:
+            completed_time_minutes += duration
+            mark, section = "✓", completed_buf
+        else:
+            mark, section = "○", incomplete_buf
+
+        priority_marker = _PRIORITY_MARKERS.get(task.priority, "")
+        section.write(
+            f"  {mark} {task.start_time}-{task.end_time}  {task.title} {priority_marker}\n"
+        )
+        if task.description:
+            section.write(f"    {_truncate(task.description)}\n")
+        section.write(f"    Duration: {_format_duration(duration)}\n\n")
+
     total_hours = total_time_minutes // 60
     total_mins = total_time_minutes % 60
     completed_hours = completed_time_minutes // 60
     completed_mins = completed_time_minutes % 60
 
-    report_lines.extend([
-        "TIME ANALYSIS",
-        "-" * 70,
-        f"Total Scheduled:  {total_hours}h {total_mins}m",
-        f"Time Completed:   {completed_hours}h {completed_mins}m",
-        "",
-    ])
-
-    # Priority breakdown
-    priority_stats = {
-        "high": {"total": 0, "completed": 0},
-        "medium": {"total": 0, "completed": 0},
-        "low": {"total": 0, "completed": 0},
-    }
-
-    for task in schedule.tasks:
-        priority_stats[task.priority]["total"] += 1
-        if task.id in state.completed_tasks:
-            priority_stats[task.priority]["completed"] += 1
-
-    report_lines.extend([
-        "PRIORITY BREAKDOWN",
-        "-" * 70,
-    ])
+    w("TIME ANALYSIS\n")
+    w(_SEP_DASH + "\n")
+    w(f"Total Scheduled:  {total_hours}h {total_mins}m\n")
+    w(f"Time Completed:   {completed_hours}h {completed_mins}m\n")
+    w("\n")
+
+    w("PRIORITY BREAKDOWN\n")
+    w(_SEP_DASH + "\n")
 
     for priority in ["high", "medium", "low"]:
-        stats = priority_stats[priority]
-        total = stats["total"]
-        completed = stats["completed"]
+        total = priority_totals[priority]
+        completed = priority_completed[priority]
         if total > 0:
             pct = (completed / total) * 100
-            report_lines.append(
-                f"{priority.upper():8}  {completed}/{total} completed ({pct:.0f}%)"
-            )
+            w(f"{priority.upper():8}  {completed}/{total} completed ({pct:.0f}%)\n")
 
-    report_lines.append("")
+    w("\n")
 
     # Completed tasks
-    completed_task_list = [
-        task for task in schedule.tasks
-        if task.id in state.completed_tasks
-    ]
-
-    if completed_task_list:
-        report_lines.extend([
-            "COMPLETED TASKS ✓",
-            "-" * 70,
-        ])
-
-        for task in completed_task_list:
-            duration = task.duration_minutes()
-            hours = duration // 60
-            mins = duration % 60
-            duration_str = f"{hours}h {mins}m" if hours > 0 else f"{mins}m"
-
-            priority_marker = {
-                "high": "!!!",
-                "medium": "!!",
-                "low": "!",
-            }.get(task.priority, "")
-
-            report_lines.append(
-                f"  ✓ {task.start_time}-{task.end_time}  {task.title} {priority_marker}"
-            )
-            if task.description:
-                report_lines.append(f"    {task.description[:60]}...")
-            report_lines.append(f"    Duration: {duration_str}")
-            report_lines.append("")
+    completed_section = completed_buf.getvalue()
+    if completed_section:
+        w("COMPLETED TASKS ✓\n")
+        w(_SEP_DASH + "\n")
+        w(completed_section)
 
     # Incomplete tasks
-    incomplete_task_list = [
-        task for task in schedule.tasks
-        if task.id not in state.completed_tasks
-    ]
-
-    if incomplete_task_list:
-        report_lines.extend([
-            "INCOMPLETE TASKS ○",
-            "-" * 70,
-        ])
-
-        for task in incomplete_task_list:
-            duration = task.duration_minutes()
-            hours = duration // 60
-            mins = duration % 60
-            duration_str = f"{hours}h {mins}m" if hours > 0 else f"{mins}m"
-
-            priority_marker = {
-                "high": "!!!",
-                "medium": "!!",
-                "low": "!",
-            }.get(task.priority, "")
-
-            report_lines.append(
-                f"  ○ {task.start_time}-{task.end_time}  {task.title} {priority_marker}"
-            )
-            if task.description:
-                report_lines.append(f"    {task.description[:60]}...")
-            report_lines.append(f"    Duration: {duration_str}")
-            report_lines.append("")
+    incomplete_section = incomplete_buf.getvalue()
+    if incomplete_section:
+        w("INCOMPLETE TASKS ○\n")
+        w(_SEP_DASH + "\n")
+        w(incomplete_section)
 
     # Recommendations
-    report_lines.extend([
-        "INSIGHTS & RECOMMENDATIONS",
-        "-" * 70,
-    ])
+    w("INSIGHTS & RECOMMENDATIONS\n")
+    w(_SEP_DASH + "\n")
 
     insights = []
 
@@ -172,36 +242,23 @@ def generate_report(schedule: Schedule, state: AppState) -> str:
         insights.append("💪 Challenging day. Focus on high-priority items first tomorrow.")
 
     # High priority tasks incomplete
-    high_priority_incomplete = [
-        task for task in incomplete_task_list
-        if task.priority == "high"
-    ]
+    high_priority_incomplete = priority_totals["high"] - priority_completed["high"]
     if high_priority_incomplete:
         insights.append(
-            f"⚠️  {len(high_priority_incomplete)} high-priority task(s) incomplete - "
+            f"⚠️  {high_priority_incomplete} high-priority task(s) incomplete - "
             "consider these for tomorrow."
         )
-
-    # All high priority completed
-    high_priority_completed = all(
-        task.id in state.completed_tasks
-        for task in schedule.tasks
-        if task.priority == "high"
-    )
-    if high_priority_completed and priority_stats["high"]["total"] > 0:
+    elif priority_totals["high"] > 0:
+        # All high priority completed
         insights.append("✨ All high-priority tasks completed!")
 
     for insight in insights:
-        report_lines.append(f"  {insight}")
+        w(f"  {insight}\n")
 
-    report_lines.extend([
-        "",
-        "=" * 70,
-        f"Report generated: {dt.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        "=" * 70,
-    ])
+    w("\n")
+    w(_SEP_EQ + "\n")
 
-    return "\n".join(report_lines)
+    return buf.getvalue()
 
 
 def save_report(
@@ -222,19 +279,72 @@ def save_report(
     # Ensure reports directory exists
     reports_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate report
-    report_content = generate_report(schedule, state)
+    # Generate report; the body's UTF-8 encoding is cached with its text
+    _, body_bytes = _cached_report_body(schedule, state)
 
     # Create filename with date
     filename = f"{schedule.date.strftime('%Y-%m-%d')}.txt"
     report_path = reports_dir / filename
 
     # Save report
-    report_path.write_text(report_content, encoding="utf-8")
+    report_path.write_bytes(body_bytes + _report_footer().encode("utf-8"))
+
+    # Record completion in the index so statistics needn't re-read the report
+    completion_pct = state.get_completion_percentage(len(schedule.tasks))
+    _append_report_index(reports_dir, report_path, completion_pct)
 
     return report_path
 
 
+def _append_report_index(reports_dir: Path, report_path: Path, completion_pct: float) -> None:
+    """Append a saved report's completion percentage to the reports index.
+
+    The index is append-only; the last entry for a file wins. Entries carry
+    the report's mtime so readers can detect reports changed since.
+
+    Args:
+        reports_dir: Directory containing reports
+        report_path: Path of the report that was just written
+        completion_pct: Completion percentage shown in the report
+    """
+    try:
+        entry = {
+            "file": report_path.name,
+            "mtime_ns": report_path.stat().st_mtime_ns,
+            "completion": round(completion_pct, 1),
+        }
+        with (reports_dir / REPORT_INDEX_FILE).open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+    except OSError:
+        # The index is only a shortcut; readers fall back to parsing reports
+        pass
+
+
+def read_report_index(reports_dir: Path) -> dict[str, tuple[int, float]]:
+    """Read the reports index written by save_report.
+
+    Args:
+        reports_dir: Directory containing reports
+
+    Returns:
+        Map of report filename to (mtime_ns, completion percentage),
+        empty if there is no readable index
+    """
+    index: dict[str, tuple[int, float]] = {}
+    try:
+        with (reports_dir / REPORT_INDEX_FILE).open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    index[entry["file"]] = (int(entry["mtime_ns"]), float(entry["completion"]))
+                except (ValueError, KeyError, TypeError):
+                    # Skip torn or malformed lines
+                    continue
+    except OSError:
+        return {}
+    return index
+
+
 def get_recent_reports(reports_dir: Path, limit: int = 5) -> list[Path]:
     """Get the most recent report files.
 
@@ -245,13 +355,16 @@ def get_recent_reports(reports_dir: Path, limit: int = 5) -> list[Path]:
     Returns:
         List of report file paths, newest first
     """
-    if not reports_dir.exists():
+    # Pick the newest .txt files without sorting the whole directory;
+    # DirEntry caches its stat result
+    try:
+        with os.scandir(reports_dir) as it:
+            entries = heapq.nlargest(
+                limit,
+                (e for e in it if e.name.endswith(".txt") and e.is_file()),
+                key=lambda e: e.stat().st_mtime,
+            )
+    except FileNotFoundError:
         return []
 
-    # Get all .txt files
-    report_files = list(reports_dir.glob("*.txt"))
-
-    # Sort by modification time, newest first
-    report_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-
-    return report_files[:limit]
+    return [Path(e.path) for e in entries]
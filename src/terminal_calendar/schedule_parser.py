@@ -1,11 +1,14 @@
 """Schedule parser for loading and validating JSON schedule files."""
 
-import json
+import functools
+import os
+import stat
 from pathlib import Path
 from typing import Any
 
 from pydantic import ValidationError
 
+from . import jsonio
 from .models import Schedule
 
 
@@ -24,6 +27,9 @@ def load_schedule(file_path: str | Path) -> Schedule:
     Returns:
         Validated Schedule object
 
+    Parsed schedules are cached by path, modification time and size, so
+    loading an unchanged file again skips reading and validation.
+
     Raises:
         ScheduleParseError: If file cannot be read or parsed
         ValidationError: If schedule data is invalid
@@ -31,29 +37,65 @@ def load_schedule(file_path: str | Path) -> Schedule:
     path = Path(file_path)
 
     # Check file exists
-    if not path.exists():
-        raise ScheduleParseError(f"Schedule file not found: {file_path}")
+    try:
+        file_stat = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        raise ScheduleParseError(f"Schedule file not found: {file_path}") from None
+    except OSError as e:
+        raise ScheduleParseError(f"Error reading file {file_path}: {e}") from e
 
     # Check file is readable
-    if not path.is_file():
+    if not stat.S_ISREG(file_stat.st_mode):
         raise ScheduleParseError(f"Path is not a file: {file_path}")
 
-    # Read and parse JSON
+    schedule = _load_schedule_cached(
+        str(file_path),
+        os.path.abspath(path),
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+    )
+    # Give each caller its own tasks so the cached copy stays intact. Task
+    # fields are immutable strings, so shallow per-task copies suffice and
+    # are far cheaper than a deep copy.
+    return schedule.model_copy(update={"tasks": [task.model_copy() for task in schedule.tasks]})
+
+
+@functools.lru_cache(maxsize=8)
+def _load_schedule_cached(file_path: str, abs_path: str, mtime_ns: int, size: int) -> Schedule:
+    """Read and validate a schedule file; memoized on the file's identity.
+
+    Args:
+        file_path: Path as given by the caller (used in error messages)
+        abs_path: Absolute path of the file to read
+        mtime_ns: Modification time of the file (cache key only)
+        size: Size of the file in bytes (cache key only)
+
+    Returns:
+        Validated Schedule object
+
+    Raises:
+        ScheduleParseError: If file cannot be read or parsed
+    """
+    path = Path(abs_path)
+
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise ScheduleParseError(f"Invalid JSON in {file_path}: {e}") from e
+        raw = path.read_bytes()
     except OSError as e:
         raise ScheduleParseError(f"Error reading file {file_path}: {e}") from e
 
-    # Validate with Pydantic
+    # Parse and validate in one pass, without building an intermediate dict
     try:
-        schedule = Schedule.model_validate(data)
+        schedule = Schedule.model_validate_json(raw)
     except ValidationError as e:
+        errors = e.errors()
+        if errors and errors[0]["type"] == "json_invalid":
+            raise ScheduleParseError(
+                f"Invalid JSON in {file_path}: {errors[0]['ctx']['error']}"
+            ) from e
+
         # Re-raise with more context
         error_messages = []
-        for error in e.errors():
+        for error in errors:
             loc = " -> ".join(str(l) for l in error["loc"])
             msg = error["msg"]
             error_messages.append(f"{loc}: {msg}")
@@ -92,7 +134,25 @@ def validate_schedule_file(file_path: str | Path) -> tuple[bool, str]:
         Tuple of (is_valid, error_message)
         If valid: (True, "")
         If invalid: (False, "error message")
+
+    Results are cached by path, modification time and size, so invalid
+    files are not re-parsed either while they stay unchanged.
     """
+    path = Path(file_path)
+    try:
+        file_stat = path.stat()
+    except OSError:
+        file_stat = None
+
+    if file_stat is not None and stat.S_ISREG(file_stat.st_mode):
+        return _validate_schedule_cached(
+            str(file_path),
+            os.path.abspath(path),
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+        )
+
+    # Missing files and non-files: load_schedule raises the matching error
     try:
         load_schedule(file_path)
         return (True, "")
@@ -100,6 +160,28 @@ def validate_schedule_file(file_path: str | Path) -> tuple[bool, str]:
         return (False, str(e))
 
 
+@functools.lru_cache(maxsize=32)
+def _validate_schedule_cached(
+    file_path: str, abs_path: str, mtime_ns: int, size: int
+) -> tuple[bool, str]:
+    """Validate a schedule file; memoized on the file's identity.
+
+    Args:
+        file_path: Path as given by the caller (used in error messages)
+        abs_path: Absolute path of the file to read
+        mtime_ns: Modification time of the file (cache key only)
+        size: Size of the file in bytes (cache key only)
+
+    Returns:
+        Tuple of (is_valid, error_message), as for validate_schedule_file
+    """
+    try:
+        _load_schedule_cached(file_path, abs_path, mtime_ns, size)
+    except ScheduleParseError as e:
+        return (False, str(e))
+    return (True, "")
+
+
 def save_schedule(schedule: Schedule, file_path: str | Path) -> None:
     """Save a schedule to a JSON file.
 
@@ -111,18 +193,12 @@ def save_schedule(schedule: Schedule, file_path: str | Path) -> None:
         ScheduleParseError: If file cannot be written
     """
     path = Path(file_path)
+    data = jsonio.dumps(schedule.model_dump(mode="json"))
 
     try:
         # Create parent directories if they don't exist
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write JSON with nice formatting
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(
-                schedule.model_dump(mode="json"),
-                f,
-                indent=2,
-                ensure_ascii=False,
-            )
+        jsonio.write_atomic(path, data)
     except OSError as e:
         raise ScheduleParseError(f"Error writing file {file_path}: {e}") from e
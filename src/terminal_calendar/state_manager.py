@@ -1,13 +1,19 @@
 """State management for terminal calendar application."""
 
-import json
+import contextlib
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from pydantic import ValidationError
 
+from . import jsonio
 from .models import AppState
 
+# Config directories already created (or found) by this process, so repeated
+# StateManager construction doesn't re-issue mkdir
+_ensured_dirs: set[Path] = set()
+
 
 class StateManagerError(Exception):
     """Exception raised when state management fails."""
@@ -40,12 +46,60 @@ class StateManager:
         self.state_file = self.config_dir / self.DEFAULT_STATE_FILE
         self._ensure_config_dir()
 
+        # Last state read from or written to disk, keyed by the file's
+        # (mtime_ns, size) so external edits are picked up on the next read.
+        self._cached_state: AppState | None = None
+        self._cached_key: tuple[int, int] | None = None
+
+        # State held in memory by an open batch() block, and whether it has
+        # changes that still need writing
+        self._batch_depth = 0
+        self._batch_state: AppState | None = None
+        self._batch_dirty = False
+
     def _ensure_config_dir(self) -> None:
         """Ensure the configuration directory exists."""
+        if self.config_dir in _ensured_dirs:
+            return
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
         except OSError as e:
             raise StateManagerError(f"Failed to create config directory: {e}") from e
+        _ensured_dirs.add(self.config_dir)
+
+    def _invalidate_cache(self) -> None:
+        """Forget the cached state so the next read goes to disk."""
+        self._cached_state = None
+        self._cached_key = None
+
+    @staticmethod
+    def _copy_state(state: AppState) -> AppState:
+        """Copy a state without re-validating it.
+
+        Only the mutable containers are duplicated; TaskNote objects are
+        never modified in place, so they are shared. This is several times
+        cheaper than a deep copy or a validate round-trip.
+
+        Args:
+            state: The state to copy
+
+        Returns:
+            A copy whose mutations do not affect the original
+        """
+        return state.model_copy(
+            update={
+                "completed_tasks": set(state.completed_tasks),
+                "task_notes": {k: list(v) for k, v in state.task_notes.items()},
+            }
+        )
+
+    def _stat_key(self) -> tuple[int, int] | None:
+        """Return the (mtime_ns, size) of the state file, or None if missing."""
+        try:
+            stat = self.state_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
 
     def save_state(self, state: AppState) -> None:
         """Save application state to disk.
@@ -56,47 +110,166 @@ class StateManager:
         Raises:
             StateManagerError: If state cannot be saved
         """
+        # Cache a private copy so later caller-side mutations don't leak in
+        self._write_state(self._copy_state(state))
+        if self._batch_depth:
+            self._batch_state = self._copy_state(state)
+            self._batch_dirty = False
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group task completion changes into a single state write.
+
+        Inside the block, mark_task_complete and mark_task_incomplete update
+        the state in memory and reads see those updates. The state is written
+        once when the block exits, and only if something changed. If the
+        block raises, the pending changes are discarded. Nested batches join
+        the outermost one.
+
+        Raises:
+            StateManagerError: If the state cannot be read or saved
+        """
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+            return
+
+        state = self._read_state()
+        self._batch_state = None if state is None else self._copy_state(state)
+        self._batch_dirty = False
+        self._batch_depth = 1
+        try:
+            yield
+            if self._batch_dirty and self._batch_state is not None:
+                self._write_state(self._batch_state)
+        finally:
+            self._batch_depth = 0
+            self._batch_state = None
+            self._batch_dirty = False
+
+    def _write_state(self, state: AppState) -> None:
+        """Write state to disk and keep it as the cached state.
+
+        Args:
+            state: The AppState object to save (owned by the cache afterwards)
+
+        Raises:
+            StateManagerError: If state cannot be saved
+        """
+        self._invalidate_cache()
         try:
-            # Convert to JSON-serializable dict
+            # Convert to JSON-serializable dict and encode up front
             state_dict = state.model_dump(mode="json")
+            data = jsonio.dumps(state_dict)
 
-            # Write to file with nice formatting
-            with self.state_file.open("w", encoding="utf-8") as f:
-                json.dump(state_dict, f, indent=2, ensure_ascii=False)
+            try:
+                jsonio.write_atomic(self.state_file, data)
+            except FileNotFoundError:
+                # The config directory was removed after it was ensured
+                _ensured_dirs.discard(self.config_dir)
+                self._ensure_config_dir()
+                jsonio.write_atomic(self.state_file, data)
 
         except OSError as e:
             raise StateManagerError(f"Failed to save state: {e}") from e
         except Exception as e:
             raise StateManagerError(f"Unexpected error saving state: {e}") from e
 
+        self._cached_state = state
+        self._cached_key = self._stat_key()
+
     def load_state(self) -> AppState | None:
         """Load application state from disk.
 
+        The parsed state is cached and only re-read when the state file
+        changes on disk. Each call returns an independent copy.
+
         Returns:
             AppState object if state file exists, None otherwise
 
         Raises:
             StateManagerError: If state file exists but cannot be loaded
         """
+        state = self._current_state()
+        if state is None:
+            return None
+        return self._copy_state(state)
+
+    def _current_state(self) -> AppState | None:
+        """Return the state in effect: the batch's state inside batch(), else the cached one.
+
+        Returns:
+            The current AppState if one exists, None otherwise
+
+        Raises:
+            StateManagerError: If state file exists but cannot be loaded
+        """
+        if self._batch_depth:
+            return self._batch_state
+        return self._read_state()
+
+    def _save_update(self, state: AppState) -> None:
+        """Persist a state changed by a mark_* method, or defer it inside batch().
+
+        Args:
+            state: The state returned by _current_state, after mutation
+
+        Raises:
+            StateManagerError: If state cannot be saved
+        """
+        if self._batch_depth:
+            self._batch_dirty = True
+        else:
+            self._write_state(state)
+
+    def _read_state(self) -> AppState | None:
+        """Return the cached state, re-reading the file only if it changed.
+
+        Callers must not mutate the returned object unless they write it
+        back with _write_state.
+
+        Returns:
+            The cached AppState if state file exists, None otherwise
+
+        Raises:
+            StateManagerError: If state file exists but cannot be loaded
+        """
+        try:
+            key = self._stat_key()
+        except OSError as e:
+            raise StateManagerError(f"Failed to read state file: {e}") from e
+
         # If state file doesn't exist, return None (first run)
-        if not self.state_file.exists():
+        if key is None:
+            self._invalidate_cache()
             return None
 
+        if self._cached_state is not None and key == self._cached_key:
+            return self._cached_state
+
         try:
-            with self.state_file.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            raw = self.state_file.read_bytes()
 
-            # Validate and convert to AppState
-            state = AppState.model_validate(data)
-            return state
+            # Parse and validate in one pass, without an intermediate dict
+            state = AppState.model_validate_json(raw)
 
-        except json.JSONDecodeError as e:
-            raise StateManagerError(f"Invalid JSON in state file: {e}") from e
         except ValidationError as e:
+            errors = e.errors()
+            if errors and errors[0]["type"] == "json_invalid":
+                raise StateManagerError(
+                    f"Invalid JSON in state file: {errors[0]['ctx']['error']}"
+                ) from e
             raise StateManagerError(f"Invalid state data: {e}") from e
         except OSError as e:
             raise StateManagerError(f"Failed to read state file: {e}") from e
 
+        self._cached_state = state
+        self._cached_key = key
+        return state
+
     def state_exists(self) -> bool:
         """Check if a state file exists.
 
@@ -111,6 +284,9 @@ class StateManager:
         Raises:
             StateManagerError: If state file cannot be deleted
         """
+        self._invalidate_cache()
+        self._batch_state = None
+        self._batch_dirty = False
         if not self.state_file.exists():
             return
 
@@ -130,7 +306,8 @@ class StateManager:
     def mark_task_complete(self, task_id: str) -> None:
         """Mark a task as complete and save state.
 
-        Loads current state, marks task complete, and saves.
+        Loads current state, marks task complete, and saves. Nothing is
+        written if the task is already complete.
 
         Args:
             task_id: The task ID to mark complete
@@ -138,17 +315,21 @@ class StateManager:
         Raises:
             StateManagerError: If no state exists or save fails
         """
-        state = self.load_state()
+        state = self._current_state()
         if state is None:
             raise StateManagerError("No state file exists. Load a schedule first.")
 
+        if task_id in state.completed_tasks:
+            return
+
         state.mark_complete(task_id)
-        self.save_state(state)
+        self._save_update(state)
 
     def mark_task_incomplete(self, task_id: str) -> None:
         """Mark a task as incomplete and save state.
 
-        Loads current state, marks task incomplete, and saves.
+        Loads current state, marks task incomplete, and saves. Nothing is
+        written if the task is already incomplete.
 
         Args:
             task_id: The task ID to mark incomplete
@@ -156,12 +337,15 @@ class StateManager:
         Raises:
             StateManagerError: If no state exists or save fails
         """
-        state = self.load_state()
+        state = self._current_state()
         if state is None:
             raise StateManagerError("No state file exists. Load a schedule first.")
 
+        if task_id not in state.completed_tasks:
+            return
+
         state.mark_incomplete(task_id)
-        self.save_state(state)
+        self._save_update(state)
 
     def get_completed_tasks(self) -> set[str]:
         """Get the set of completed task IDs.
@@ -169,11 +353,11 @@ class StateManager:
         Returns:
             Set of completed task IDs, empty set if no state exists
         """
-        state = self.load_state()
+        state = self._current_state()
         if state is None:
             return set()
 
-        return state.completed_tasks
+        return set(state.completed_tasks)
 
     def is_task_complete(self, task_id: str) -> bool:
         """Check if a task is marked as complete.
@@ -184,8 +368,8 @@ class StateManager:
         Returns:
             True if complete, False otherwise
         """
-        completed = self.get_completed_tasks()
-        return task_id in completed
+        state = self._current_state()
+        return state is not None and task_id in state.completed_tasks
 
     def create_reports_dir(self) -> Path:
         """Create and return the reports directory.
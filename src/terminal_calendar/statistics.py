@@ -1,13 +1,40 @@
 """Statistics and analytics for terminal calendar."""
 
+import copy
 import datetime as dt
+import functools
+import heapq
+import io
 import json
+import os
+import re
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
 
 from pydantic import BaseModel
 
 from .models import Schedule, AppState
+from .report_generator import REPORT_INDEX_FILE, read_report_index
+
+# Matches the "Completed:        X (Y%)" summary line of a saved report
+_COMPLETION_RE = re.compile(r"Completed:\s+\d+\s+\((\d+(?:\.\d+)?)%\)")
+
+_SEP_EQ = "=" * 70
+_SEP_DASH = "-" * 70
+
+_TREND_EMOJI = {
+    "improving": "📈",
+    "declining": "📉",
+    "stable": "➡️",
+    "insufficient_data": "❓",
+}
+
+_TREND_MSG = {
+    "improving": "Productivity is improving! Keep it up!",
+    "declining": "Productivity trending down. Consider adjusting your schedule.",
+    "stable": "Productivity is consistent.",
+    "insufficient_data": "Need more data for trend analysis.",
+}
 
 
 class DayStats(BaseModel):
@@ -44,31 +71,37 @@ def calculate_day_stats(schedule: Schedule, state: AppState) -> DayStats:
     Returns:
         DayStats object with calculated statistics
     """
+    completed_ids = state.completed_tasks
     total = len(schedule.tasks)
-    completed = len(state.completed_tasks)
-
-    total_minutes = sum(task.duration_minutes() for task in schedule.tasks)
-    completed_minutes = sum(
-        task.duration_minutes()
-        for task in schedule.tasks
-        if state.is_complete(task.id)
-    )
-
-    high_priority_tasks = [t for t in schedule.tasks if t.priority == "high"]
-    high_priority_completed = len([
-        t for t in high_priority_tasks
-        if state.is_complete(t.id)
-    ])
+    completed = len(completed_ids)
+    completion_pct = state.get_completion_percentage(total)
+
+    starts, ends = schedule.minute_bounds()
+    total_minutes = sum(ends) - sum(starts)
+
+    # Single pass over tasks for completed time and high-priority counters
+    completed_minutes = 0
+    high_priority_total = 0
+    high_priority_completed = 0
+    for task, start, end in zip(schedule.tasks, starts, ends, strict=True):
+        duration = end - start
+        done = task.id in completed_ids
+        if done:
+            completed_minutes += duration
+        if task.priority == "high":
+            high_priority_total += 1
+            if done:
+                high_priority_completed += 1
 
     return DayStats(
         date=schedule.date,
         total_tasks=total,
         completed_tasks=completed,
-        completion_percentage=state.get_completion_percentage(total),
+        completion_percentage=completion_pct,
         total_minutes=total_minutes,
         completed_minutes=completed_minutes,
         high_priority_completed=high_priority_completed,
-        high_priority_total=len(high_priority_tasks),
+        high_priority_total=high_priority_total,
     )
 
 
@@ -78,6 +111,9 @@ def analyze_productivity_trends(
 ) -> Dict[str, any]:
     """Analyze productivity trends from recent reports.
 
+    Results are cached in memory until a report is added, removed, or saved
+    through save_report (which always appends to the reports index).
+
     Args:
         reports_dir: Directory containing report files
         days: Number of days to analyze
@@ -85,46 +121,82 @@ def analyze_productivity_trends(
     Returns:
         Dictionary with trend statistics
     """
-    if not reports_dir.exists():
+    try:
+        dir_mtime_ns = reports_dir.stat().st_mtime_ns
+    except FileNotFoundError:
         return {
             "error": "No reports directory found",
             "days_analyzed": 0,
         }
 
-    # Get recent report files
-    report_files = sorted(
-        reports_dir.glob("*.txt"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )[:days]
+    try:
+        index_stat = (reports_dir / REPORT_INDEX_FILE).stat()
+        index_key = (index_stat.st_mtime_ns, index_stat.st_size)
+    except FileNotFoundError:
+        index_key = None
+
+    stats = _analyze_productivity_trends_cached(reports_dir, days, dir_mtime_ns, index_key)
+    # Hand out a copy so callers can't mutate the cached result
+    return copy.deepcopy(stats)
+
+
+@functools.lru_cache(maxsize=32)
+def _analyze_productivity_trends_cached(
+    reports_dir: Path,
+    days: int,
+    dir_mtime_ns: int,
+    index_key: tuple[int, int] | None,
+) -> dict[str, Any]:
+    """Compute productivity trends; memoized on the directory and index state.
+
+    Args:
+        reports_dir: Directory containing report files
+        days: Number of days to analyze
+        dir_mtime_ns: Modification time of reports_dir (cache key only)
+        index_key: (mtime_ns, size) of the reports index (cache key only)
+
+    Returns:
+        Dictionary with trend statistics
+    """
+    # Get the most recent report files without sorting the whole directory
+    try:
+        with os.scandir(reports_dir) as it:
+            report_entries = heapq.nlargest(
+                days,
+                (e for e in it if e.name.endswith(".txt") and e.is_file()),
+                key=lambda e: e.stat().st_mtime,
+            )
+    except FileNotFoundError:
+        return {
+            "error": "No reports directory found",
+            "days_analyzed": 0,
+        }
 
-    if not report_files:
+    if not report_entries:
         return {
             "error": "No reports found",
             "days_analyzed": 0,
         }
 
-    # Parse basic stats from reports
+    # Parse basic stats from reports, using the index when it is up to date
+    index = read_report_index(reports_dir)
     daily_completions = []
-    for report_file in report_files:
+    for entry in report_entries:
+        indexed = index.get(entry.name)
+        if indexed is not None and indexed[0] == entry.stat().st_mtime_ns:
+            daily_completions.append(indexed[1])
+            continue
+
         try:
-            content = report_file.read_text()
-            # Extract completion percentage from report
-            for line in content.split("\n"):
-                if "Completed:" in line and "(" in line:
-                    # Parse "Completed:        X (Y%)" format
-                    parts = line.split("(")
-                    if len(parts) > 1:
-                        pct_str = parts[1].split("%")[0]
-                        try:
-                            pct = float(pct_str)
-                            daily_completions.append(pct)
-                            break
-                        except ValueError:
-                            pass
+            content = Path(entry.path).read_text()
         except Exception:
             continue
 
+        # Extract completion percentage from report
+        match = _COMPLETION_RE.search(content)
+        if match:
+            daily_completions.append(float(match.group(1)))
+
     if not daily_completions:
         return {
             "error": "Could not parse reports",
@@ -175,56 +247,37 @@ def generate_statistics_report(reports_dir: Path, days: int = 7) -> str:
     if "error" in stats:
         return f"⚠️  {stats['error']}"
 
-    lines = [
-        "=" * 70,
-        f"PRODUCTIVITY STATISTICS - Last {stats['days_analyzed']} Days",
-        "=" * 70,
-        "",
-        "OVERVIEW",
-        "-" * 70,
-        f"Average Completion:  {stats['average_completion']}%",
-        f"Best Day:            {stats['max_completion']}%",
-        f"Lowest Day:          {stats['min_completion']}%",
-        "",
-    ]
-
-    # Trend analysis
-    trend_emoji = {
-        "improving": "📈",
-        "declining": "📉",
-        "stable": "➡️",
-        "insufficient_data": "❓",
-    }
+    buf = io.StringIO()
+    w = buf.write
 
-    trend_msg = {
-        "improving": "Productivity is improving! Keep it up!",
-        "declining": "Productivity trending down. Consider adjusting your schedule.",
-        "stable": "Productivity is consistent.",
-        "insufficient_data": "Need more data for trend analysis.",
-    }
+    w(_SEP_EQ + "\n")
+    w(f"PRODUCTIVITY STATISTICS - Last {stats['days_analyzed']} Days\n")
+    w(_SEP_EQ + "\n")
+    w("\n")
+    w("OVERVIEW\n")
+    w(_SEP_DASH + "\n")
+    w(f"Average Completion:  {stats['average_completion']}%\n")
+    w(f"Best Day:            {stats['max_completion']}%\n")
+    w(f"Lowest Day:          {stats['min_completion']}%\n")
+    w("\n")
 
-    lines.extend([
-        "TREND ANALYSIS",
-        "-" * 70,
-        f"Trend: {trend_emoji.get(stats['trend'], '')} {trend_msg.get(stats['trend'], '')}",
-        "",
-    ])
+    # Trend analysis
+    w("TREND ANALYSIS\n")
+    w(_SEP_DASH + "\n")
+    w(f"Trend: {_TREND_EMOJI.get(stats['trend'], '')} {_TREND_MSG.get(stats['trend'], '')}\n")
+    w("\n")
 
     # Daily breakdown
-    lines.extend([
-        "DAILY COMPLETIONS",
-        "-" * 70,
-    ])
+    w("DAILY COMPLETIONS\n")
+    w(_SEP_DASH + "\n")
 
     for i, completion in enumerate(stats['daily_completions']):
         day_label = f"Day -{i}" if i > 0 else "Today"
         bar_length = int(completion / 2)  # Scale to 50 chars max
         bar = "█" * bar_length
-        lines.append(f"{day_label:8}  {bar} {completion}%")
+        w(f"{day_label:8}  {bar} {completion}%\n")
 
-    lines.extend([
-        "",
-        "=" * 70,
-    ])
+    w("\n")
+    w(_SEP_EQ)
 
-    return "\n".join(lines)
+    return buf.getvalue()
@@ -1,40 +1,70 @@
 """Schedule validation for terminal calendar."""
 
-import datetime as dt
-from typing import List, Tuple
+import heapq
+from collections.abc import Callable
+from enum import StrEnum
+from typing import NamedTuple
 
 from .models import Schedule, Task
 
 
-class ValidationWarning:
+class Severity(StrEnum):
+    """Severity level of a validation warning."""
+
+    ERROR = "error"
+    WARNING = "warning"
+
+
+class WarningType(StrEnum):
+    """Kind of issue a validation warning reports."""
+
+    OVERLAP = "overlap"
+    SHORT_GAP = "short_gap"
+    LARGE_GAP = "large_gap"
+    SHORT_DURATION = "short_duration"
+    LONG_DURATION = "long_duration"
+
+
+# Tasks shorter or longer than these (in minutes) get a duration warning
+_SHORT_TASK_MINUTES = 5
+_LONG_TASK_MINUTES = 240
+
+# Message templates per warning type, formatted on demand with the
+# warning's args
+_MESSAGE_TEMPLATES = {
+    WarningType.OVERLAP: "Tasks overlap: '{0}' ({1}-{2}) and '{3}' ({4}-{5})",
+    WarningType.SHORT_GAP: "Short transition time ({0}m) between '{1}' and '{2}'",
+    WarningType.LARGE_GAP: "Large gap ({0}) between '{1}' and '{2}'",
+    WarningType.SHORT_DURATION: (
+        "Very short task ({0}m): '{1}'. Consider combining with adjacent tasks."
+    ),
+    WarningType.LONG_DURATION: (
+        "Very long task ({0}h): '{1}'. Consider breaking into smaller tasks."
+    ),
+}
+
+
+class ValidationWarning(NamedTuple):
     """A validation warning with details.
 
+    The human-readable message is only formatted when ``message`` is read.
+
     Attributes:
         type: Type of warning (overlap, gap, etc.)
-        message: Human-readable warning message
+        args: Values substituted into the message template for ``type``
         tasks: Tasks involved in the warning
         severity: Severity level (warning, error)
     """
 
-    def __init__(
-        self,
-        type: str,
-        message: str,
-        tasks: List[Task] | None = None,
-        severity: str = "warning",
-    ) -> None:
-        """Initialize a validation warning.
-
-        Args:
-            type: Type of warning
-            message: Warning message
-            tasks: Related tasks
-            severity: Severity level
-        """
-        self.type = type
-        self.message = message
-        self.tasks = tasks or []
-        self.severity = severity
+    type: WarningType
+    args: tuple[object, ...]
+    tasks: tuple[Task, ...] = ()
+    severity: Severity = Severity.WARNING
+
+    @property
+    def message(self) -> str:
+        """Human-readable warning message."""
+        return _MESSAGE_TEMPLATES[self.type].format(*self.args)
 
     def __str__(self) -> str:
         """String representation of the warning."""
@@ -47,9 +77,12 @@ def validate_schedule(
     warn_gaps: bool = False,
     min_gap_minutes: int = 5,
     max_gap_minutes: int = 120,
-) -> List[ValidationWarning]:
+) -> list[ValidationWarning]:
     """Validate a schedule for issues.
 
+    All checks share a single walk over the tasks in start-time order.
+    Warnings are returned grouped as overlaps, then gaps, then durations.
+
     Args:
         schedule: The schedule to validate
         warn_overlapping: Check for overlapping tasks
@@ -60,204 +93,197 @@ def validate_schedule(
     Returns:
         List of validation warnings
     """
-    warnings = []
-
-    if warn_overlapping:
-        warnings.extend(_check_overlapping_tasks(schedule))
-
-    if warn_gaps:
-        warnings.extend(_check_gaps(schedule, min_gap_minutes, max_gap_minutes))
-
-    warnings.extend(_check_task_duration(schedule))
-
-    return warnings
-
-
-def _check_overlapping_tasks(schedule: Schedule) -> List[ValidationWarning]:
-    """Check for overlapping tasks.
-
-    Args:
-        schedule: The schedule to check
-
-    Returns:
-        List of warnings for overlapping tasks
-    """
-    warnings = []
     tasks = schedule.tasks
 
-    for i, task1 in enumerate(tasks):
-        for task2 in tasks[i + 1:]:
-            if _tasks_overlap(task1, task2):
-                message = (
-                    f"Tasks overlap: '{task1.title}' ({task1.start_time}-{task1.end_time}) "
-                    f"and '{task2.title}' ({task2.start_time}-{task2.end_time})"
-                )
-                warnings.append(
-                    ValidationWarning(
-                        type="overlap",
-                        message=message,
-                        tasks=[task1, task2],
-                        severity="error",
-                    )
+    # Flat minute sequences so the walk below does integer indexing only.
+    # Schedule keeps tasks sorted by start time, so the stable sort is
+    # normally a no-op that preserves the list order.
+    starts, ends = schedule.minute_bounds()
+    order = sorted(range(len(tasks)), key=starts.__getitem__)
+
+    # Overlaps use a sweep line: a min-heap of still-running tasks keyed on
+    # end time. Every task left on the heap after expiring those that ended
+    # by the current start overlaps the current task. While tasks start at
+    # or after the latest end seen so far (the usual case) nothing can
+    # overlap, and the heap is simply reset to the current task.
+    active: list[tuple[int, int]] = []
+    max_end = -1
+    overlap_pairs: list[tuple[int, int]] = []
+    # (earlier index, later index, gap) and (index, duration) for each hit;
+    # warnings are only built for these after the walk
+    gap_hits: list[tuple[int, int, int]] = []
+    duration_hits: list[tuple[int, int]] = []
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+    prev_idx = -1
+
+    for idx in order:
+        start_mins = starts[idx]
+        end_mins = ends[idx]
+
+        if warn_overlapping:
+            if start_mins >= max_end:
+                active = [(end_mins, idx)]
+            else:
+                # The task ending at max_end is still on the heap, so it
+                # never empties here
+                while active[0][0] <= start_mins:
+                    heappop(active)
+                overlap_pairs.extend(
+                    [(other, idx) if other < idx else (idx, other) for _, other in active]
                 )
+                heappush(active, (end_mins, idx))
+            if end_mins > max_end:
+                max_end = end_mins
+
+        if warn_gaps and prev_idx >= 0:
+            gap = start_mins - ends[prev_idx]
+            if 0 < gap < min_gap_minutes or gap > max_gap_minutes:
+                gap_hits.append((prev_idx, idx, gap))
+        prev_idx = idx
+
+        duration = end_mins - start_mins
+        if duration < _SHORT_TASK_MINUTES or duration > _LONG_TASK_MINUTES:
+            duration_hits.append((idx, duration))
+
+    # Report overlapping pairs in schedule order, as a pairwise scan would
+    overlap_pairs.sort()
+    warnings = [_overlap_warning(tasks[i], tasks[j]) for i, j in overlap_pairs]
+    warnings.extend(
+        _gap_warning(tasks[i], tasks[j], gap, min_gap_minutes) for i, j, gap in gap_hits
+    )
+    warnings.extend(_duration_warning(tasks[i], duration) for i, duration in duration_hits)
 
     return warnings
 
 
-def _tasks_overlap(task1: Task, task2: Task) -> bool:
-    """Check if two tasks overlap in time.
+def make_validator(
+    warn_overlapping: bool = True,
+    warn_gaps: bool = False,
+    min_gap_minutes: int = 5,
+    max_gap_minutes: int = 120,
+) -> Callable[[Schedule], list[ValidationWarning]]:
+    """Build a validator with fixed check settings.
+
+    Useful when many schedules are checked with the same configuration.
 
     Args:
-        task1: First task
-        task2: Second task
+        warn_overlapping: Check for overlapping tasks
+        warn_gaps: Check for large gaps
+        min_gap_minutes: Minimum gap for buffer
+        max_gap_minutes: Maximum gap before warning
 
     Returns:
-        True if tasks overlap, False otherwise
+        A function taking a schedule and returning its validation warnings
     """
-    start1 = task1.get_start_time()
-    end1 = task1.get_end_time()
-    start2 = task2.get_start_time()
-    end2 = task2.get_end_time()
 
-    # Convert to minutes for easier comparison
-    start1_mins = start1.hour * 60 + start1.minute
-    end1_mins = end1.hour * 60 + end1.minute
-    start2_mins = start2.hour * 60 + start2.minute
-    end2_mins = end2.hour * 60 + end2.minute
+    def validate(schedule: Schedule) -> list[ValidationWarning]:
+        return validate_schedule(
+            schedule,
+            warn_overlapping,
+            warn_gaps,
+            min_gap_minutes,
+            max_gap_minutes,
+        )
 
-    # Check if they overlap
-    return not (end1_mins <= start2_mins or end2_mins <= start1_mins)
+    return validate
 
 
-def _check_gaps(
-    schedule: Schedule,
-    min_gap_minutes: int,
-    max_gap_minutes: int,
-) -> List[ValidationWarning]:
-    """Check for gaps between tasks.
+def _overlap_warning(task1: Task, task2: Task) -> ValidationWarning:
+    """Build the warning for a pair of overlapping tasks.
 
     Args:
-        schedule: The schedule to check
-        min_gap_minutes: Minimum gap for transition
-        max_gap_minutes: Maximum gap before warning
+        task1: Earlier task in the schedule
+        task2: Later task in the schedule
 
     Returns:
-        List of warnings for gaps
+        Overlap warning
     """
-    warnings = []
-    tasks = schedule.tasks
-
-    for i in range(len(tasks) - 1):
-        task1 = tasks[i]
-        task2 = tasks[i + 1]
-
-        gap_minutes = _calculate_gap(task1, task2)
-
-        # Warn about no buffer time
-        if 0 < gap_minutes < min_gap_minutes:
-            message = (
-                f"Short transition time ({gap_minutes}m) between "
-                f"'{task1.title}' and '{task2.title}'"
-            )
-            warnings.append(
-                ValidationWarning(
-                    type="short_gap",
-                    message=message,
-                    tasks=[task1, task2],
-                    severity="warning",
-                )
-            )
-
-        # Warn about large gaps
-        elif gap_minutes > max_gap_minutes:
-            hours = gap_minutes // 60
-            mins = gap_minutes % 60
-            gap_str = f"{hours}h {mins}m" if hours > 0 else f"{mins}m"
-
-            message = (
-                f"Large gap ({gap_str}) between "
-                f"'{task1.title}' and '{task2.title}'"
-            )
-            warnings.append(
-                ValidationWarning(
-                    type="large_gap",
-                    message=message,
-                    tasks=[task1, task2],
-                    severity="warning",
-                )
-            )
-
-    return warnings
-
-
-def _calculate_gap(task1: Task, task2: Task) -> int:
-    """Calculate the gap in minutes between two tasks.
+    return ValidationWarning(
+        type=WarningType.OVERLAP,
+        args=(
+            task1.title,
+            task1.start_time,
+            task1.end_time,
+            task2.title,
+            task2.start_time,
+            task2.end_time,
+        ),
+        tasks=(task1, task2),
+        severity=Severity.ERROR,
+    )
+
+
+def _gap_warning(
+    task1: Task,
+    task2: Task,
+    gap_minutes: int,
+    min_gap_minutes: int,
+) -> ValidationWarning:
+    """Build the warning for a too-short or too-long gap between tasks.
 
     Args:
         task1: First task (earlier)
         task2: Second task (later)
+        gap_minutes: Minutes between the end of task1 and start of task2
+        min_gap_minutes: Minimum gap for transition
 
     Returns:
-        Gap in minutes
+        A short-gap warning if the gap is under the minimum, otherwise a
+        large-gap warning
     """
-    end1 = task1.get_end_time()
-    start2 = task2.get_start_time()
-
-    end1_mins = end1.hour * 60 + end1.minute
-    start2_mins = start2.hour * 60 + start2.minute
-
-    return start2_mins - end1_mins
-
-
-def _check_task_duration(schedule: Schedule) -> List[ValidationWarning]:
-    """Check for unrealistic task durations.
+    # Warn about no buffer time
+    if 0 < gap_minutes < min_gap_minutes:
+        return ValidationWarning(
+            type=WarningType.SHORT_GAP,
+            args=(gap_minutes, task1.title, task2.title),
+            tasks=(task1, task2),
+            severity=Severity.WARNING,
+        )
+
+    # Warn about large gaps
+    hours = gap_minutes // 60
+    mins = gap_minutes % 60
+    gap_str = f"{hours}h {mins}m" if hours > 0 else f"{mins}m"
+
+    return ValidationWarning(
+        type=WarningType.LARGE_GAP,
+        args=(gap_str, task1.title, task2.title),
+        tasks=(task1, task2),
+        severity=Severity.WARNING,
+    )
+
+
+def _duration_warning(task: Task, duration: int) -> ValidationWarning:
+    """Build the warning for a very short or very long task.
 
     Args:
-        schedule: The schedule to check
+        task: The task to warn about
+        duration: Task duration in minutes
 
     Returns:
-        List of warnings for duration issues
+        A short-duration warning if the task is under the minimum length,
+        otherwise a long-duration warning
     """
-    warnings = []
-
-    for task in schedule.tasks:
-        duration = task.duration_minutes()
-
-        # Warn about very short tasks (< 5 minutes)
-        if duration < 5:
-            message = (
-                f"Very short task ({duration}m): '{task.title}'. "
-                "Consider combining with adjacent tasks."
-            )
-            warnings.append(
-                ValidationWarning(
-                    type="short_duration",
-                    message=message,
-                    tasks=[task],
-                    severity="warning",
-                )
-            )
-
-        # Warn about very long tasks (> 4 hours)
-        elif duration > 240:
-            hours = duration // 60
-            message = (
-                f"Very long task ({hours}h): '{task.title}'. "
-                "Consider breaking into smaller tasks."
-            )
-            warnings.append(
-                ValidationWarning(
-                    type="long_duration",
-                    message=message,
-                    tasks=[task],
-                    severity="warning",
-                )
-            )
-
-    return warnings
-
-
-def format_validation_report(warnings: List[ValidationWarning]) -> str:
+    # Warn about very short tasks (< 5 minutes)
+    if duration < _SHORT_TASK_MINUTES:
+        return ValidationWarning(
+            type=WarningType.SHORT_DURATION,
+            args=(duration, task.title),
+            tasks=(task,),
+            severity=Severity.WARNING,
+        )
+
+    # Warn about very long tasks (> 4 hours)
+    return ValidationWarning(
+        type=WarningType.LONG_DURATION,
+        args=(duration // 60, task.title),
+        tasks=(task,),
+        severity=Severity.WARNING,
+    )
+
+
+def format_validation_report(warnings: list[ValidationWarning]) -> str:
     """Format validation warnings as a readable report.
 
     Args:
@@ -271,22 +297,25 @@ def format_validation_report(warnings: List[ValidationWarning]) -> str:
 
     lines = ["⚠️  Schedule Validation Warnings:", ""]
 
-    # Group by severity
-    errors = [w for w in warnings if w.severity == "error"]
-    warnings_list = [w for w in warnings if w.severity == "warning"]
+    # Split by severity in a single pass
+    error_lines = []
+    warning_lines = []
+    for warning in warnings:
+        if warning.severity == Severity.ERROR:
+            error_lines.append(f"  ✗ {warning.message}")
+        elif warning.severity == Severity.WARNING:
+            warning_lines.append(f"  ⚠ {warning.message}")
 
-    if errors:
+    if error_lines:
         lines.append("ERRORS:")
-        for warning in errors:
-            lines.append(f"  ✗ {warning.message}")
+        lines.extend(error_lines)
         lines.append("")
 
-    if warnings_list:
+    if warning_lines:
         lines.append("WARNINGS:")
-        for warning in warnings_list:
-            lines.append(f"  ⚠ {warning.message}")
+        lines.extend(warning_lines)
         lines.append("")
 
-    lines.append(f"Total: {len(errors)} error(s), {len(warnings_list)} warning(s)")
+    lines.append(f"Total: {len(error_lines)} error(s), {len(warning_lines)} warning(s)")
 
     return "\n".join(lines)
@@ -3,7 +3,6 @@
 import datetime as dt
 import json
 from pathlib import Path
-import tempfile
 
 import pytest
 from click.testing import CliRunner
@@ -2,17 +2,18 @@
 
 import datetime as dt
 from pathlib import Path
-import tempfile
 
 import pytest
 
 from terminal_calendar.config import ConfigManager, Config
-from terminal_calendar.export import export_to_ical, export_to_csv, export_to_json
+from terminal_calendar.export import export_all, export_to_ical, export_to_csv, export_to_json
 from terminal_calendar.models import Schedule, Task, AppState
-from terminal_calendar.validator import validate_schedule, ValidationWarning
+from terminal_calendar.report_generator import save_report
+from terminal_calendar.statistics import analyze_productivity_trends
+from terminal_calendar.validator import make_validator, validate_schedule, ValidationWarning
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_schedule() -> Schedule:
     """Create a sample schedule."""
     return Schedule(
@@ -43,7 +44,7 @@ def sample_schedule() -> Schedule:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def overlapping_schedule() -> Schedule:
     """Create a schedule with overlapping tasks."""
     return Schedule(
@@ -70,48 +71,68 @@ def overlapping_schedule() -> Schedule:
 class TestConfigManager:
     """Tests for configuration management."""
 
-    def test_load_default_config(self) -> None:
+    def test_load_default_config(self, tmp_path: Path) -> None:
         """Test loading default configuration."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_manager = ConfigManager(config_dir=Path(tmpdir))
-            config = config_manager.load_config()
+        config_manager = ConfigManager(config_dir=tmp_path)
+        config = config_manager.load_config()
 
-            assert isinstance(config, Config)
-            assert config.ui.auto_refresh_interval == 60
-            assert config.theme.current_task_color == "yellow"
-            assert config.validation.warn_overlapping is True
+        assert isinstance(config, Config)
+        assert config.ui.auto_refresh_interval == 60
+        assert config.theme.current_task_color == "yellow"
+        assert config.validation.warn_overlapping is True
 
-    def test_save_and_load_config(self) -> None:
+    def test_save_and_load_config(self, tmp_path: Path) -> None:
         """Test saving and loading configuration."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_manager = ConfigManager(config_dir=Path(tmpdir))
+        config_manager = ConfigManager(config_dir=tmp_path)
 
-            # Modify and save
-            config = config_manager.load_config()
-            config.ui.auto_refresh_interval = 120
-            config.theme.current_task_color = "blue"
-            config_manager.save_config(config)
+        # Modify and save
+        config = config_manager.load_config()
+        config.ui.auto_refresh_interval = 120
+        config.theme.current_task_color = "blue"
+        config_manager.save_config(config)
 
-            # Load and verify
-            loaded_config = config_manager.load_config()
-            assert loaded_config.ui.auto_refresh_interval == 120
-            assert loaded_config.theme.current_task_color == "blue"
+        # Load and verify
+        loaded_config = config_manager.load_config()
+        assert loaded_config.ui.auto_refresh_interval == 120
+        assert loaded_config.theme.current_task_color == "blue"
 
-    def test_reset_config(self) -> None:
+    def test_reset_config(self, tmp_path: Path) -> None:
         """Test resetting configuration."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_manager = ConfigManager(config_dir=Path(tmpdir))
+        config_manager = ConfigManager(config_dir=tmp_path)
 
-            # Modify
-            config = config_manager.load_config()
-            config.ui.auto_refresh_interval = 999
-            config_manager.save_config(config)
+        # Modify
+        config = config_manager.load_config()
+        config.ui.auto_refresh_interval = 999
+        config_manager.save_config(config)
 
-            # Reset
-            config_manager.reset_config()
-            loaded_config = config_manager.load_config()
+        # Reset
+        config_manager.reset_config()
+        loaded_config = config_manager.load_config()
 
-            assert loaded_config.ui.auto_refresh_interval == 60  # Default
+        assert loaded_config.ui.auto_refresh_interval == 60  # Default
+
+    def test_loaded_configs_are_independent(self, tmp_path: Path) -> None:
+        """Test that modifying a loaded config does not leak into the cache."""
+        config_manager = ConfigManager(config_dir=tmp_path)
+        config_manager.save_config(Config())
+
+        config = config_manager.load_config()
+        config.ui.auto_refresh_interval = 300
+
+        assert config_manager.load_config().ui.auto_refresh_interval == 60
+
+    def test_load_config_picks_up_external_changes(self, tmp_path: Path) -> None:
+        """Test that the config is re-read after the file changes on disk."""
+        config_manager = ConfigManager(config_dir=tmp_path)
+        config_manager.save_config(Config())
+        assert config_manager.load_config().ui.auto_refresh_interval == 60
+
+        other_manager = ConfigManager(config_dir=tmp_path)
+        config = other_manager.load_config()
+        config.ui.auto_refresh_interval = 300
+        other_manager.save_config(config)
+
+        assert config_manager.load_config().ui.auto_refresh_interval == 300
 
 
 class TestValidator:
@@ -134,6 +155,34 @@ class TestValidator:
         assert len(overlap_errors) >= 1
         assert "overlap" in overlap_errors[0].message.lower()
 
+    def test_overlap_pairs_in_schedule_order(self) -> None:
+        """Test that every overlapping pair is reported once, in order."""
+        schedule = Schedule(
+            date=dt.date(2024, 3, 15),
+            tasks=[
+                Task(id="a", title="A", start_time="09:00", end_time="12:00"),
+                Task(id="b", title="B", start_time="09:30", end_time="10:00"),
+                Task(id="c", title="C", start_time="10:00", end_time="10:30"),
+                Task(id="d", title="D", start_time="12:00", end_time="13:00"),
+                Task(id="e", title="E", start_time="12:30", end_time="12:45"),
+            ],
+        )
+
+        warnings = validate_schedule(schedule, warn_overlapping=True)
+        pairs = [tuple(task.id for task in w.tasks) for w in warnings if w.type == "overlap"]
+
+        # Back-to-back tasks (b/c, a/d) do not overlap
+        assert pairs == [("a", "b"), ("a", "c"), ("d", "e")]
+
+    def test_make_validator_matches_validate_schedule(self, overlapping_schedule: Schedule) -> None:
+        """Test that a prebuilt validator applies its fixed settings."""
+        validate = make_validator(warn_overlapping=False, warn_gaps=True)
+
+        assert validate(overlapping_schedule) == validate_schedule(
+            overlapping_schedule, warn_overlapping=False, warn_gaps=True
+        )
+        assert not any(w.type == "overlap" for w in validate(overlapping_schedule))
+
     def test_detect_gaps(self, sample_schedule: Schedule) -> None:
         """Test detection of gaps between tasks."""
         # No gaps in sample schedule
@@ -248,87 +297,145 @@ class TestTaskNotes:
 class TestExport:
     """Tests for export functionality."""
 
-    def test_export_to_ical(self, sample_schedule: Schedule) -> None:
+    def test_export_to_ical(self, sample_schedule: Schedule, tmp_path: Path) -> None:
         """Test exporting to iCal format."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "schedule.ics"
-            export_to_ical(sample_schedule, output_path)
+        output_path = tmp_path / "schedule.ics"
+        export_to_ical(sample_schedule, output_path)
 
-            assert output_path.exists()
-            content = output_path.read_text()
+        assert output_path.exists()
+        content = output_path.read_text()
 
-            assert "BEGIN:VCALENDAR" in content
-            assert "END:VCALENDAR" in content
-            assert "BEGIN:VEVENT" in content
-            assert "Morning Meeting" in content
+        assert "BEGIN:VCALENDAR" in content
+        assert "END:VCALENDAR" in content
+        assert "BEGIN:VEVENT" in content
+        assert "Morning Meeting" in content
 
-    def test_export_to_csv(self, sample_schedule: Schedule) -> None:
+    def test_export_to_csv(self, sample_schedule: Schedule, tmp_path: Path) -> None:
         """Test exporting to CSV format."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "schedule.csv"
-            export_to_csv(sample_schedule, output_path)
+        output_path = tmp_path / "schedule.csv"
+        export_to_csv(sample_schedule, output_path)
 
-            assert output_path.exists()
-            content = output_path.read_text()
+        assert output_path.exists()
+        content = output_path.read_text()
 
-            assert "task_id" in content
-            assert "Morning Meeting" in content
-            assert "task1" in content
+        assert "task_id" in content
+        assert "Morning Meeting" in content
+        assert "task1" in content
 
-    def test_export_to_csv_with_state(self, sample_schedule: Schedule) -> None:
+    def test_export_to_csv_with_state(self, sample_schedule: Schedule, tmp_path: Path) -> None:
         """Test exporting to CSV with completion state."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state = AppState(
-                schedule_file="test.json",
-                schedule_date=sample_schedule.date,
-                completed_tasks={"task1"},
-            )
+        state = AppState(
+            schedule_file="test.json",
+            schedule_date=sample_schedule.date,
+            completed_tasks={"task1"},
+        )
+
+        output_path = tmp_path / "schedule.csv"
+        export_to_csv(sample_schedule, output_path, state)
+
+        content = output_path.read_text()
+        assert "completed" in content.lower()
+        assert "Yes" in content  # task1 is completed
+
+    def test_export_all(self, sample_schedule: Schedule, tmp_path: Path) -> None:
+        """Test exporting every format in one call."""
+        state = AppState(
+            schedule_file="test.json",
+            schedule_date=sample_schedule.date,
+            completed_tasks={"task1"},
+        )
 
-            output_path = Path(tmpdir) / "schedule.csv"
-            export_to_csv(sample_schedule, output_path, state)
+        paths = export_all(sample_schedule, tmp_path / "out", state)
 
-            content = output_path.read_text()
-            assert "completed" in content.lower()
-            assert "Yes" in content  # task1 is completed
+        assert sorted(paths) == ["csv", "ical", "json"]
+        assert paths["ical"].name == "schedule-2024-03-15.ics"
+        assert "BEGIN:VCALENDAR" in paths["ical"].read_text()
+        assert "Yes" in paths["csv"].read_text()
+        assert '"completed": true' in paths["json"].read_text()
 
-    def test_export_to_json(self, sample_schedule: Schedule) -> None:
+    def test_export_to_json(self, sample_schedule: Schedule, tmp_path: Path) -> None:
         """Test exporting to JSON format."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "schedule.json"
-            export_to_json(sample_schedule, output_path)
+        output_path = tmp_path / "schedule.json"
+        export_to_json(sample_schedule, output_path)
 
-            assert output_path.exists()
+        assert output_path.exists()
 
-            import json
-            with output_path.open() as f:
-                data = json.load(f)
+        import json
+        with output_path.open() as f:
+            data = json.load(f)
 
-            assert data["date"] == "2024-03-15"
-            assert len(data["tasks"]) == 3
-            assert data["tasks"][0]["title"] == "Morning Meeting"
+        assert data["date"] == "2024-03-15"
+        assert len(data["tasks"]) == 3
+        assert data["tasks"][0]["title"] == "Morning Meeting"
 
-    def test_export_to_json_with_state(self, sample_schedule: Schedule) -> None:
+    def test_export_to_json_with_state(self, sample_schedule: Schedule, tmp_path: Path) -> None:
         """Test exporting to JSON with completion state."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state = AppState(
-                schedule_file="test.json",
-                schedule_date=sample_schedule.date,
-                completed_tasks={"task1"},
-            )
-            state.add_note("task1", "Test note")
-
-            output_path = Path(tmpdir) / "schedule.json"
-            export_to_json(sample_schedule, output_path, state, include_notes=True)
-
-            import json
-            with output_path.open() as f:
-                data = json.load(f)
-
-            # Check completion status
-            task1_data = [t for t in data["tasks"] if t["id"] == "task1"][0]
-            assert task1_data["completed"] is True
-
-            # Check notes
-            assert "notes" in task1_data
-            assert len(task1_data["notes"]) == 1
-            assert task1_data["notes"][0]["content"] == "Test note"
+        state = AppState(
+            schedule_file="test.json",
+            schedule_date=sample_schedule.date,
+            completed_tasks={"task1"},
+        )
+        state.add_note("task1", "Test note")
+
+        output_path = tmp_path / "schedule.json"
+        export_to_json(sample_schedule, output_path, state, include_notes=True)
+
+        import json
+        with output_path.open() as f:
+            data = json.load(f)
+
+        # Check completion status
+        task1_data = [t for t in data["tasks"] if t["id"] == "task1"][0]
+        assert task1_data["completed"] is True
+
+        # Check notes
+        assert "notes" in task1_data
+        assert len(task1_data["notes"]) == 1
+        assert task1_data["notes"][0]["content"] == "Test note"
+
+
+class TestStatistics:
+    """Tests for productivity statistics."""
+
+    def test_trends_from_saved_reports(self, sample_schedule: Schedule, tmp_path: Path) -> None:
+        """Test that trends use the completion recorded by save_report."""
+        reports_dir = tmp_path
+        state = AppState(
+            schedule_file="test.json",
+            schedule_date=sample_schedule.date,
+            completed_tasks={"task1"},
+        )
+        save_report(sample_schedule, state, reports_dir)
+
+        stats = analyze_productivity_trends(reports_dir)
+
+        assert stats["days_analyzed"] == 1
+        assert stats["daily_completions"] == [33.3]
+
+    def test_trends_parse_unindexed_reports(self, tmp_path: Path) -> None:
+        """Test that reports missing from the index are parsed directly."""
+        reports_dir = tmp_path
+        (reports_dir / "2024-03-15.txt").write_text("Completed:        3 (75.0%)\n")
+
+        stats = analyze_productivity_trends(reports_dir)
+
+        assert stats["days_analyzed"] == 1
+        assert stats["daily_completions"] == [75.0]
+
+    def test_trends_refresh_after_report_overwrite(
+        self, sample_schedule: Schedule, tmp_path: Path
+    ) -> None:
+        """Test that cached trends are invalidated when a report is re-saved."""
+        reports_dir = tmp_path
+        state = AppState(
+            schedule_file="test.json",
+            schedule_date=sample_schedule.date,
+        )
+        save_report(sample_schedule, state, reports_dir)
+        assert analyze_productivity_trends(reports_dir)["daily_completions"] == [0.0]
+
+        state.mark_complete("task1")
+        state.mark_complete("task2")
+        state.mark_complete("task3")
+        save_report(sample_schedule, state, reports_dir)
+        assert analyze_productivity_trends(reports_dir)["daily_completions"] == [100.0]
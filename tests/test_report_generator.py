@@ -1,8 +1,8 @@
 """Tests for report generation functionality."""
 
 import datetime as dt
+import os
 from pathlib import Path
-import tempfile
 
 import pytest
 
@@ -11,10 +11,11 @@ from terminal_calendar.report_generator import (
     generate_report,
     save_report,
     get_recent_reports,
+    read_report_index,
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_schedule() -> Schedule:
     """Create a sample schedule for testing."""
     return Schedule(
@@ -135,9 +136,8 @@ class TestGenerateReport:
 
         # Check task placement
         lines = report.split("\n")
-        completed_section = "\n".join(
-            lines[lines.index([l for l in lines if "COMPLETED TASKS" in l][0]):]
-        )
+        idx = next(i for i, line in enumerate(lines) if "COMPLETED TASKS" in line)
+        completed_section = "\n".join(lines[idx:])
         assert "Morning Standup" in completed_section
         assert "Lunch Break" in completed_section
 
@@ -263,99 +263,142 @@ class TestGenerateReport:
         report = generate_report(schedule, state)
         # Should be truncated to 60 chars plus "..."
         assert "A" * 60 + "..." in report
+        assert "A" * 61 not in report
+
+    def test_short_descriptions_not_truncated(
+        self, sample_schedule: Schedule, empty_state: AppState
+    ) -> None:
+        """Test that short descriptions are shown without an ellipsis."""
+        report = generate_report(sample_schedule, empty_state)
+        assert "    Daily team sync\n" in report
+        assert "Daily team sync..." not in report
+
+    def test_report_reflects_changes_after_caching(
+        self, sample_schedule: Schedule, empty_state: AppState
+    ) -> None:
+        """Test that a cached report is not reused once inputs change."""
+        schedule = sample_schedule.model_copy(deep=True)
+        first = generate_report(schedule, empty_state)
+        assert generate_report(schedule, empty_state).startswith(
+            first.split("Report generated:")[0]
+        )
+
+        schedule.tasks[0].title = "Renamed Standup"
+        empty_state.mark_complete(schedule.tasks[0].id)
+        report = generate_report(schedule, empty_state)
+
+        assert "✓ 09:00-09:30  Renamed Standup" in report
+        assert "Completed:        1 (25.0%)" in report
 
 
 class TestSaveReport:
     """Tests for save_report function."""
 
     def test_save_report_creates_file(
-        self, sample_schedule: Schedule, partial_state: AppState
+        self, sample_schedule: Schedule, partial_state: AppState, tmp_path: Path
     ) -> None:
         """Test that save_report creates a file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            reports_dir = Path(tmpdir)
-            report_path = save_report(sample_schedule, partial_state, reports_dir)
+        reports_dir = tmp_path
+        report_path = save_report(sample_schedule, partial_state, reports_dir)
 
-            assert report_path.exists()
-            assert report_path.is_file()
+        assert report_path.exists()
+        assert report_path.is_file()
 
     def test_save_report_filename(
-        self, sample_schedule: Schedule, partial_state: AppState
+        self, sample_schedule: Schedule, partial_state: AppState, tmp_path: Path
     ) -> None:
         """Test that report filename is date-based."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            reports_dir = Path(tmpdir)
-            report_path = save_report(sample_schedule, partial_state, reports_dir)
+        reports_dir = tmp_path
+        report_path = save_report(sample_schedule, partial_state, reports_dir)
 
-            assert report_path.name == "2024-03-15.txt"
+        assert report_path.name == "2024-03-15.txt"
 
     def test_save_report_content(
-        self, sample_schedule: Schedule, partial_state: AppState
+        self, sample_schedule: Schedule, partial_state: AppState, tmp_path: Path
     ) -> None:
         """Test that saved report contains correct content."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            reports_dir = Path(tmpdir)
-            report_path = save_report(sample_schedule, partial_state, reports_dir)
+        reports_dir = tmp_path
+        report_path = save_report(sample_schedule, partial_state, reports_dir)
 
-            content = report_path.read_text(encoding="utf-8")
-            assert "DAILY PRODUCTIVITY REPORT" in content
-            assert "Morning Standup" in content
+        content = report_path.read_text(encoding="utf-8")
+        assert "DAILY PRODUCTIVITY REPORT" in content
+        assert "Morning Standup" in content
 
     def test_save_report_creates_directory(
-        self, sample_schedule: Schedule, partial_state: AppState
+        self, sample_schedule: Schedule, partial_state: AppState, tmp_path: Path
     ) -> None:
         """Test that save_report creates reports directory if missing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            reports_dir = Path(tmpdir) / "reports"
-            assert not reports_dir.exists()
+        reports_dir = tmp_path / "reports"
+        assert not reports_dir.exists()
 
-            report_path = save_report(sample_schedule, partial_state, reports_dir)
+        report_path = save_report(sample_schedule, partial_state, reports_dir)
 
-            assert reports_dir.exists()
-            assert report_path.exists()
+        assert reports_dir.exists()
+        assert report_path.exists()
 
     def test_save_report_overwrites_existing(
-        self, sample_schedule: Schedule
+        self, sample_schedule: Schedule, tmp_path: Path
     ) -> None:
         """Test that save_report overwrites existing report."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            reports_dir = Path(tmpdir)
-
-            # Save with empty state
-            state1 = AppState(
-                schedule_file="test.json",
-                schedule_date=dt.date(2024, 3, 15),
-            )
-            report_path1 = save_report(sample_schedule, state1, reports_dir)
-            content1 = report_path1.read_text()
-
-            # Save again with completed state
-            state2 = AppState(
-                schedule_file="test.json",
-                schedule_date=dt.date(2024, 3, 15),
-                completed_tasks={"task1", "task2", "task3", "task4"},
-            )
-            report_path2 = save_report(sample_schedule, state2, reports_dir)
-            content2 = report_path2.read_text()
-
-            # Should be same file
-            assert report_path1 == report_path2
-
-            # Content should be different
-            assert "Completed:        0" in content1
-            assert "Completed:        4" in content2
+        reports_dir = tmp_path
+
+        # Save with empty state
+        state1 = AppState(
+            schedule_file="test.json",
+            schedule_date=dt.date(2024, 3, 15),
+        )
+        report_path1 = save_report(sample_schedule, state1, reports_dir)
+        content1 = report_path1.read_text()
+
+        # Save again with completed state
+        state2 = AppState(
+            schedule_file="test.json",
+            schedule_date=dt.date(2024, 3, 15),
+            completed_tasks={"task1", "task2", "task3", "task4"},
+        )
+        report_path2 = save_report(sample_schedule, state2, reports_dir)
+        content2 = report_path2.read_text()
+
+        # Should be same file
+        assert report_path1 == report_path2
+
+        # Content should be different
+        assert "Completed:        0" in content1
+        assert "Completed:        4" in content2
+
+    def test_save_report_updates_index(
+        self, sample_schedule: Schedule, partial_state: AppState, tmp_path: Path
+    ) -> None:
+        """Test that save_report records completion in the reports index."""
+        reports_dir = tmp_path
+        report_path = save_report(sample_schedule, partial_state, reports_dir)
+
+        index = read_report_index(reports_dir)
+        assert index == {
+            "2024-03-15.txt": (report_path.stat().st_mtime_ns, 50.0),
+        }
+
+    def test_get_recent_reports_ignores_index(
+        self, sample_schedule: Schedule, partial_state: AppState, tmp_path: Path
+    ) -> None:
+        """Test that the reports index is not listed as a report."""
+        reports_dir = tmp_path
+        save_report(sample_schedule, partial_state, reports_dir)
+
+        reports = get_recent_reports(reports_dir, limit=5)
+
+        assert [p.name for p in reports] == ["2024-03-15.txt"]
 
 
 class TestGetRecentReports:
     """Tests for get_recent_reports function."""
 
-    def test_get_recent_reports_empty_dir(self) -> None:
+    def test_get_recent_reports_empty_dir(self, tmp_path: Path) -> None:
         """Test with empty reports directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            reports_dir = Path(tmpdir)
-            reports = get_recent_reports(reports_dir, limit=5)
+        reports_dir = tmp_path
+        reports = get_recent_reports(reports_dir, limit=5)
 
-            assert reports == []
+        assert reports == []
 
     def test_get_recent_reports_nonexistent_dir(self) -> None:
         """Test with nonexistent directory."""
@@ -364,72 +407,67 @@ class TestGetRecentReports:
 
         assert reports == []
 
-    def test_get_recent_reports_returns_files(self) -> None:
+    def test_get_recent_reports_returns_files(self, tmp_path: Path) -> None:
         """Test that recent reports are returned."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            reports_dir = Path(tmpdir)
+        reports_dir = tmp_path
 
-            # Create some report files
-            (reports_dir / "2024-03-15.txt").write_text("Report 1")
-            (reports_dir / "2024-03-14.txt").write_text("Report 2")
-            (reports_dir / "2024-03-13.txt").write_text("Report 3")
+        # Create some report files
+        (reports_dir / "2024-03-15.txt").write_text("Report 1")
+        (reports_dir / "2024-03-14.txt").write_text("Report 2")
+        (reports_dir / "2024-03-13.txt").write_text("Report 3")
 
-            reports = get_recent_reports(reports_dir, limit=5)
+        reports = get_recent_reports(reports_dir, limit=5)
 
-            assert len(reports) == 3
-            assert all(p.suffix == ".txt" for p in reports)
+        assert len(reports) == 3
+        assert all(p.suffix == ".txt" for p in reports)
 
-    def test_get_recent_reports_sorted_by_mtime(self) -> None:
+    def test_get_recent_reports_sorted_by_mtime(self, tmp_path: Path) -> None:
         """Test that reports are sorted by modification time."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            reports_dir = Path(tmpdir)
-
-            # Create files with different timestamps
-            import time
+        reports_dir = tmp_path
 
-            file1 = reports_dir / "2024-03-13.txt"
-            file1.write_text("Report 1")
-            time.sleep(0.01)
+        # Create files with explicit, distinct timestamps
+        file1 = reports_dir / "2024-03-13.txt"
+        file1.write_text("Report 1")
+        os.utime(file1, (1000, 1000))
 
-            file2 = reports_dir / "2024-03-14.txt"
-            file2.write_text("Report 2")
-            time.sleep(0.01)
+        file2 = reports_dir / "2024-03-14.txt"
+        file2.write_text("Report 2")
+        os.utime(file2, (2000, 2000))
 
-            file3 = reports_dir / "2024-03-15.txt"
-            file3.write_text("Report 3")
+        file3 = reports_dir / "2024-03-15.txt"
+        file3.write_text("Report 3")
+        os.utime(file3, (3000, 3000))
 
-            reports = get_recent_reports(reports_dir, limit=5)
+        reports = get_recent_reports(reports_dir, limit=5)
 
-            # Should be newest first
-            assert reports[0].name == "2024-03-15.txt"
-            assert reports[1].name == "2024-03-14.txt"
-            assert reports[2].name == "2024-03-13.txt"
+        # Should be newest first
+        assert reports[0].name == "2024-03-15.txt"
+        assert reports[1].name == "2024-03-14.txt"
+        assert reports[2].name == "2024-03-13.txt"
 
-    def test_get_recent_reports_respects_limit(self) -> None:
+    def test_get_recent_reports_respects_limit(self, tmp_path: Path) -> None:
         """Test that limit parameter is respected."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            reports_dir = Path(tmpdir)
+        reports_dir = tmp_path
 
-            # Create many files
-            for i in range(10):
-                (reports_dir / f"2024-03-{i+1:02d}.txt").write_text(f"Report {i}")
+        # Create many files
+        for i in range(10):
+            (reports_dir / f"2024-03-{i+1:02d}.txt").write_text(f"Report {i}")
 
-            reports = get_recent_reports(reports_dir, limit=3)
+        reports = get_recent_reports(reports_dir, limit=3)
 
-            assert len(reports) == 3
+        assert len(reports) == 3
 
-    def test_get_recent_reports_ignores_non_txt(self) -> None:
+    def test_get_recent_reports_ignores_non_txt(self, tmp_path: Path) -> None:
         """Test that non-.txt files are ignored."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            reports_dir = Path(tmpdir)
+        reports_dir = tmp_path
 
-            # Create various files
-            (reports_dir / "2024-03-15.txt").write_text("Report")
-            (reports_dir / "2024-03-14.json").write_text("{}")
-            (reports_dir / "notes.md").write_text("# Notes")
-            (reports_dir / ".hidden").write_text("hidden")
+        # Create various files
+        (reports_dir / "2024-03-15.txt").write_text("Report")
+        (reports_dir / "2024-03-14.json").write_text("{}")
+        (reports_dir / "notes.md").write_text("# Notes")
+        (reports_dir / ".hidden").write_text("hidden")
 
-            reports = get_recent_reports(reports_dir, limit=5)
+        reports = get_recent_reports(reports_dir, limit=5)
 
-            assert len(reports) == 1
-            assert reports[0].name == "2024-03-15.txt"
+        assert len(reports) == 1
+        assert reports[0].name == "2024-03-15.txt"
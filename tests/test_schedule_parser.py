@@ -52,6 +52,35 @@ class TestLoadSchedule:
         with pytest.raises(ScheduleParseError, match="not a file"):
             load_schedule(tmp_path)
 
+    def test_load_returns_independent_task_lists(self) -> None:
+        """Test that repeated loads of a cached file don't share task lists."""
+        first = load_schedule(FIXTURES_DIR / "valid_schedule.json")
+        first.tasks.clear()
+
+        second = load_schedule(FIXTURES_DIR / "valid_schedule.json")
+        assert len(second.tasks) == 2
+
+    def test_load_returns_independent_tasks(self) -> None:
+        """Test that mutating a loaded task doesn't leak into later loads."""
+        first = load_schedule(FIXTURES_DIR / "valid_schedule.json")
+        first.tasks[0].title = "MUTATED"
+
+        second = load_schedule(FIXTURES_DIR / "valid_schedule.json")
+        assert second.tasks[0].title == "Morning standup"
+
+    def test_load_rereads_modified_file(self, tmp_path: Path) -> None:
+        """Test that a changed file is re-read rather than served from cache."""
+        schedule_path = tmp_path / "schedule.json"
+        schedule = Schedule(date=date(2026, 2, 13), tasks=[])
+        save_schedule(schedule, schedule_path)
+        assert load_schedule(schedule_path).tasks == []
+
+        schedule.tasks.append(
+            Task(id="task_1", title="Added", start_time="09:00", end_time="10:00")
+        )
+        save_schedule(schedule, schedule_path)
+        assert [t.id for t in load_schedule(schedule_path).tasks] == ["task_1"]
+
 
 class TestLoadScheduleDict:
     """Tests for load_schedule_dict function."""
@@ -140,6 +169,16 @@ class TestValidateScheduleFile:
         assert not is_valid
         assert "not found" in error
 
+    def test_validate_rechecks_modified_file(self, tmp_path: Path) -> None:
+        """Test that a cached result is dropped once the file changes."""
+        path = tmp_path / "schedule.json"
+        path.write_text("{not json", encoding="utf-8")
+        assert validate_schedule_file(path)[0] is False
+        assert validate_schedule_file(path)[0] is False
+
+        path.write_text('{"date": "2026-02-13", "tasks": []}', encoding="utf-8")
+        assert validate_schedule_file(path) == (True, "")
+
 
 class TestSaveSchedule:
     """Tests for save_schedule function."""
@@ -183,6 +222,26 @@ class TestSaveSchedule:
 
         assert save_path.exists()
 
+    def test_save_overwrites_without_temp_file(self, tmp_path: Path) -> None:
+        """Test that saving over an existing file replaces it cleanly."""
+        save_path = tmp_path / "schedule.json"
+        save_path.write_text("stale", encoding="utf-8")
+
+        save_schedule(Schedule(date=date(2026, 2, 13), tasks=[]), save_path)
+
+        assert load_schedule(save_path).date == date(2026, 2, 13)
+        assert [p.name for p in tmp_path.iterdir()] == ["schedule.json"]
+
+    def test_failed_save_removes_temp_file(self, tmp_path: Path) -> None:
+        """Test that a save that cannot replace the target cleans up after itself."""
+        save_path = tmp_path / "schedule.json"
+        (save_path / "occupied").mkdir(parents=True)
+
+        with pytest.raises(ScheduleParseError, match="Error writing file"):
+            save_schedule(Schedule(date=date(2026, 2, 13), tasks=[]), save_path)
+
+        assert [p.name for p in tmp_path.iterdir()] == ["schedule.json"]
+
 
 class TestTaskSorting:
     """Test that tasks are automatically sorted by start time."""
@@ -291,6 +350,46 @@ class TestScheduleMethods:
         upcoming = sample_schedule.get_upcoming_tasks(time(20, 0), limit=3)
         assert len(upcoming) == 0
 
+    def test_get_current_task_with_overlaps(self) -> None:
+        """Test that the earliest running task wins when tasks overlap."""
+        schedule = Schedule(
+            date=date(2026, 2, 13),
+            tasks=[
+                Task(id="long", title="Workshop", start_time="09:00", end_time="12:00"),
+                Task(id="short", title="Call", start_time="10:00", end_time="10:30"),
+                Task(id="late", title="Lunch", start_time="12:00", end_time="13:00"),
+            ],
+        )
+
+        assert schedule.get_current_task(time(10, 15)).id == "long"
+        assert schedule.get_current_task(time(11, 0)).id == "long"
+        assert schedule.get_current_task(time(11, 59, 59)).id == "long"
+        assert schedule.get_current_task(time(12, 0)).id == "late"
+        assert schedule.get_current_task(time(8, 59)) is None
+        assert schedule.get_current_task(time(13, 0)) is None
+
+        # Out-of-order lists are still handled
+        schedule.tasks.reverse()
+        assert schedule.get_current_task(time(10, 15)).id == "short"
+        assert [t.id for t in schedule.get_upcoming_tasks(time(9, 30))] == ["late", "short"]
+
+    def test_lookups_return_tasks_from_own_list(self, sample_schedule: Schedule) -> None:
+        """Test that a copy with equal tasks returns its own Task objects."""
+        assert sample_schedule.get_current_task(time(9, 30)) is sample_schedule.tasks[0]
+
+        copied = sample_schedule.model_copy(
+            update={"tasks": [task.model_copy() for task in sample_schedule.tasks]}
+        )
+        assert copied.get_current_task(time(9, 30)) is copied.tasks[0]
+        assert copied.get_upcoming_tasks(time(9, 30))[0] is copied.tasks[1]
+
+    def test_minute_bounds(self, sample_schedule: Schedule) -> None:
+        """Test start/end minutes, including refresh after the list changes."""
+        assert sample_schedule.minute_bounds() == ((540, 840, 1020), (600, 900, 1080))
+
+        sample_schedule.tasks.pop(0)
+        assert sample_schedule.minute_bounds() == ((840, 1020), (900, 1080))
+
 
 class TestTaskModel:
     """Test Task model methods."""
@@ -317,3 +416,31 @@ class TestTaskModel:
         )
 
         assert task.duration_minutes() == 90
+
+    def test_time_changes_refresh_cached_values(self) -> None:
+        """Test that derived times follow assignment and model_copy updates."""
+        task = Task(id="test", title="Test", start_time="09:00", end_time="10:00")
+        assert task.duration_minutes() == 60
+
+        task.start_time = "09:45"
+        assert task.start_minutes == 585
+        assert task.get_start_time() == time(9, 45)
+        assert task.duration_minutes() == 15
+
+        copied = task.model_copy(update={"start_time": "09:30", "end_time": "11:00"})
+        assert copied.get_start_time() == time(9, 30)
+        assert copied.get_end_time() == time(11, 0)
+        assert copied.duration_minutes() == 90
+        assert task.duration_minutes() == 15
+
+    def test_time_changes_refresh_schedule_lookups(self) -> None:
+        """Test that schedules notice in-place changes to a task's times."""
+        schedule = Schedule(
+            date=date(2026, 2, 13),
+            tasks=[Task(id="test", title="Test", start_time="09:00", end_time="10:00")],
+        )
+        assert schedule.minute_bounds() == ((540,), (600,))
+
+        schedule.tasks[0].end_time = "11:00"
+        assert schedule.minute_bounds() == ((540,), (660,))
+        assert schedule.get_current_task(time(10, 30)).id == "test"
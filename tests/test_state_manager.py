@@ -33,6 +33,17 @@ class TestStateManagerInit:
         assert manager.config_dir == custom_dir
         assert custom_dir.exists()
 
+    def test_save_recreates_removed_directory(self, tmp_path: Path) -> None:
+        """Test that saving works after an ensured config dir is deleted."""
+        config_dir = tmp_path / "config"
+        StateManager(config_dir=config_dir)
+        config_dir.rmdir()
+
+        manager = StateManager(config_dir=config_dir)
+        manager.save_state(AppState(schedule_file="/s.json", schedule_date=dt.date(2026, 2, 13)))
+
+        assert manager.state_file.exists()
+
     def test_state_file_path(self, tmp_path: Path) -> None:
         """Test state file path is set correctly."""
         manager = StateManager(config_dir=tmp_path)
@@ -98,6 +109,13 @@ class TestSaveAndLoadState:
         assert loaded is not None
         assert "task_3" in loaded.completed_tasks
 
+    def test_save_leaves_no_temp_file(self, manager: StateManager, sample_state: AppState) -> None:
+        """Test that the atomic save cleans up its temp file."""
+        manager.save_state(sample_state)
+        manager.save_state(sample_state)
+
+        assert [p.name for p in manager.config_dir.iterdir()] == ["state.json"]
+
     def test_load_invalid_json(self, manager: StateManager) -> None:
         """Test loading state with invalid JSON."""
         # Write invalid JSON
@@ -115,6 +133,64 @@ class TestSaveAndLoadState:
             manager.load_state()
 
 
+class TestStateCache:
+    """Tests for the in-memory state cache."""
+
+    @pytest.fixture
+    def manager(self, tmp_path: Path) -> StateManager:
+        """Create a state manager with saved state."""
+        mgr = StateManager(config_dir=tmp_path)
+        mgr.save_state(
+            AppState(
+                schedule_file="/path/to/schedule.json",
+                schedule_date=dt.date(2026, 2, 13),
+                completed_tasks={"task_1"},
+            )
+        )
+        return mgr
+
+    def test_load_returns_independent_copies(self, manager: StateManager) -> None:
+        """Test that mutating a loaded state does not affect later loads."""
+        state = manager.load_state()
+        assert state is not None
+        state.mark_complete("task_2")
+
+        reloaded = manager.load_state()
+        assert reloaded is not None
+        assert reloaded.completed_tasks == {"task_1"}
+
+    def test_loaded_notes_are_independent(self, manager: StateManager) -> None:
+        """Test that adding notes to a loaded state does not affect later loads."""
+        state = manager.load_state()
+        assert state is not None
+        state.add_note("task_1", "Note")
+
+        reloaded = manager.load_state()
+        assert reloaded is not None
+        assert reloaded.get_notes("task_1") == []
+
+    def test_save_does_not_alias_caller_state(self, tmp_path: Path) -> None:
+        """Test that mutating a state after saving it does not affect the cache."""
+        manager = StateManager(config_dir=tmp_path)
+        state = AppState(
+            schedule_file="/path/to/schedule.json",
+            schedule_date=dt.date(2026, 2, 13),
+        )
+        manager.save_state(state)
+        state.mark_complete("task_1")
+
+        assert not manager.is_task_complete("task_1")
+
+    def test_picks_up_external_changes(self, manager: StateManager) -> None:
+        """Test that edits made to the file by another process are re-read."""
+        assert manager.is_task_complete("task_1")
+
+        other = StateManager(config_dir=manager.config_dir)
+        other.mark_task_complete("task_2")
+
+        assert manager.get_completed_tasks() == {"task_1", "task_2"}
+
+
 class TestStateExists:
     """Tests for state_exists method."""
 
@@ -182,6 +258,42 @@ class TestTaskCompletion:
         assert state is not None
         assert "task_1" not in state.completed_tasks
 
+    def test_redundant_marks_do_not_rewrite(self, manager: StateManager) -> None:
+        """Test that marking a task with its current status skips the write."""
+        before = manager.state_file.stat().st_mtime_ns
+
+        manager.mark_task_complete("task_1")
+        manager.mark_task_incomplete("task_2")
+
+        assert manager.state_file.stat().st_mtime_ns == before
+        assert manager.get_completed_tasks() == {"task_1"}
+
+    def test_batch_writes_once_on_exit(self, manager: StateManager) -> None:
+        """Test that changes inside batch() are visible but written on exit."""
+        before = manager.state_file.read_bytes()
+
+        with manager.batch():
+            manager.mark_task_complete("task_2")
+            manager.mark_task_complete("task_3")
+            manager.mark_task_incomplete("task_1")
+
+            assert manager.get_completed_tasks() == {"task_2", "task_3"}
+            assert manager.state_file.read_bytes() == before
+
+        assert StateManager(config_dir=manager.config_dir).get_completed_tasks() == {
+            "task_2",
+            "task_3",
+        }
+
+    def test_batch_discards_changes_on_error(self, manager: StateManager) -> None:
+        """Test that a batch aborted by an exception writes nothing."""
+        with pytest.raises(RuntimeError):
+            with manager.batch():
+                manager.mark_task_complete("task_2")
+                raise RuntimeError("abort")
+
+        assert manager.get_completed_tasks() == {"task_1"}
+
     def test_mark_complete_no_state(self, tmp_path: Path) -> None:
         """Test marking complete when no state exists."""
         manager = StateManager(config_dir=tmp_path)